@@ -5,10 +5,9 @@ MP3 support, volume control, and synchronization with lyrics.
 """
 
 import os
-import threading
 import time
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Iterable, List
 from dataclasses import dataclass
 
 try:
@@ -17,8 +16,17 @@ try:
 except ImportError:
     PYGAME_AVAILABLE = False
 
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.ogg')
+DIRECTORY_CACHE_TTL = 2.0  # Seconds before the audio directory is rescanned
+MIXER_SETTINGS = {'frequency': 44100, 'size': -16, 'channels': 2, 'buffer': 1024}
 
-@dataclass
+# The mixer is shared by every AudioPlayer: it is initialized once and only
+# shut down when the last player using it is cleaned up
+_MIXER_READY = False
+_ACTIVE_PLAYERS = 0
+
+
+@dataclass(slots=True)
 class AudioInfo:
     """Information about an audio file."""
     filename: str
@@ -41,12 +49,13 @@ class AudioPlayer:
         self.is_playing = False
         self.is_paused = False
         self.current_file = None
-        self.start_time = 0
-        self.pause_time = 0
+        self._start_ns = 0
+        self._pause_ns = 0
+        self._play_offset_ms = 0
         self.volume = 0.7
         self.position_callback: Optional[Callable[[float], None]] = None
-        self._position_thread = None
-        self._stop_position_thread = False
+        self._dir_cache: Optional[Dict[str, os.DirEntry]] = None
+        self._dir_cache_time = 0.0
         
         if PYGAME_AVAILABLE:
             self._initialize_pygame()
@@ -57,14 +66,65 @@ class AudioPlayer:
         Returns:
             True if initialization successful
         """
-        try:
-            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
-            pygame.mixer.init()
-            self.is_initialized = True
-            return True
-        except pygame.error:
-            self.is_initialized = False
-            return False
+        global _MIXER_READY, _ACTIVE_PLAYERS
+        
+        if not _MIXER_READY:
+            try:
+                pygame.mixer.pre_init(**MIXER_SETTINGS)
+                pygame.mixer.init()
+            except pygame.error:
+                self.is_initialized = False
+                return False
+            _MIXER_READY = True
+        
+        _ACTIVE_PLAYERS += 1
+        self.is_initialized = True
+        return True
+    
+    def _scan(self) -> Dict[str, os.DirEntry]:
+        """Get a snapshot of the audio files in the audio directory.
+        
+        The directory is read with a single scandir pass and the result is
+        reused for DIRECTORY_CACHE_TTL seconds. DirEntry objects cache their
+        stat() result, so file info is fetched at most once per snapshot.
+        
+        Returns:
+            Dictionary mapping lowercase filenames to directory entries
+        """
+        now = time.monotonic()
+        if self._dir_cache is None or now - self._dir_cache_time > DIRECTORY_CACHE_TTL:
+            try:
+                with os.scandir(self.audio_directory) as entries:
+                    self._dir_cache = {
+                        entry.name.lower(): entry
+                        for entry in entries
+                        if entry.name.lower().endswith(AUDIO_EXTENSIONS) and entry.is_file()
+                    }
+            except FileNotFoundError:
+                self._dir_cache = {}
+            self._dir_cache_time = now
+        return self._dir_cache
+    
+    def _resolve(self, filename: str) -> Optional[Path]:
+        """Find an audio file in the directory snapshot.
+        
+        Args:
+            filename: Audio file name or path, with or without extension
+            
+        Returns:
+            Path of the matching file, or None if not found
+        """
+        name = os.path.basename(filename).lower()
+        audio_files = self._scan()
+        
+        entry = audio_files.get(name)
+        if entry is None and not name.endswith(AUDIO_EXTENSIONS):
+            # Try different extensions if not provided
+            for ext in AUDIO_EXTENSIONS:
+                entry = audio_files.get(name + ext)
+                if entry is not None:
+                    break
+        return Path(entry.path) if entry is not None else None
     
     def is_audio_available(self) -> bool:
         """Check if audio functionality is available.
@@ -86,22 +146,14 @@ class AudioPlayer:
         if not self.is_audio_available():
             return False
         
-        # Try different extensions if not provided
-        if not filename.endswith(('.mp3', '.wav', '.ogg')):
-            for ext in ['.mp3', '.wav', '.ogg']:
-                test_path = self.audio_directory / (filename + ext)
-                if test_path.exists():
-                    filename = filename + ext
-                    break
+        file_path = self._resolve(filename)
         
-        file_path = self.audio_directory / filename
-        
-        if not file_path.exists():
+        if file_path is None:
             return False
         
         try:
             pygame.mixer.music.load(str(file_path))
-            self.current_file = filename
+            self.current_file = file_path.name
             return True
         except pygame.error:
             return False
@@ -123,8 +175,8 @@ class AudioPlayer:
             pygame.mixer.music.play(start=start_position)
             self.is_playing = True
             self.is_paused = False
-            self.start_time = time.time() - start_position
-            self._start_position_tracking()
+            self._start_ns = time.monotonic_ns() - int(start_position * 1_000_000_000)
+            self._play_offset_ms = int(start_position * 1000)
             return True
         except pygame.error:
             return False
@@ -141,8 +193,7 @@ class AudioPlayer:
         try:
             pygame.mixer.music.pause()
             self.is_paused = True
-            self.pause_time = time.time()
-            self._stop_position_tracking()
+            self._pause_ns = time.monotonic_ns()
             return True
         except pygame.error:
             return False
@@ -160,9 +211,7 @@ class AudioPlayer:
             pygame.mixer.music.unpause()
             self.is_paused = False
             # Adjust start time to account for pause duration
-            pause_duration = time.time() - self.pause_time
-            self.start_time += pause_duration
-            self._start_position_tracking()
+            self._start_ns += time.monotonic_ns() - self._pause_ns
             return True
         except pygame.error:
             return False
@@ -180,7 +229,6 @@ class AudioPlayer:
             pygame.mixer.music.stop()
             self.is_playing = False
             self.is_paused = False
-            self._stop_position_tracking()
             return True
         except pygame.error:
             return False
@@ -222,7 +270,27 @@ class AudioPlayer:
         if not self.is_playing or self.is_paused:
             return 0.0
         
-        return time.time() - self.start_time
+        return (time.monotonic_ns() - self._start_ns) / 1_000_000_000
+    
+    def get_position_ms(self) -> int:
+        """Get the playback position reported by the audio device.
+        
+        Unlike get_position, this follows the audio actually played, so it
+        doesn't drift from what the user hears.
+        
+        Returns:
+            Position in milliseconds, or -1 if not available
+        """
+        if not self.is_audio_available() or not self.is_playing:
+            return -1
+        
+        try:
+            position = pygame.mixer.music.get_pos()
+        except pygame.error:
+            return -1
+        
+        # get_pos counts from the last play() call, not the track start
+        return position + self._play_offset_ms if position >= 0 else -1
     
     def seek(self, position: float) -> bool:
         """Seek to a specific position.
@@ -254,28 +322,14 @@ class AudioPlayer:
         """
         self.position_callback = callback
     
-    def _start_position_tracking(self) -> None:
-        """Start position tracking thread."""
-        if self._position_thread and self._position_thread.is_alive():
-            return
-        
-        self._stop_position_thread = False
-        self._position_thread = threading.Thread(target=self._position_tracker, daemon=True)
-        self._position_thread.start()
-    
-    def _stop_position_tracking(self) -> None:
-        """Stop position tracking thread."""
-        self._stop_position_thread = True
-        if self._position_thread:
-            self._position_thread.join(timeout=1.0)
-    
-    def _position_tracker(self) -> None:
-        """Track playback position and call callback."""
-        while not self._stop_position_thread and self.is_playing:
-            if not self.is_paused and self.position_callback:
-                position = self.get_position()
-                self.position_callback(position)
-            time.sleep(0.1)  # Update every 100ms
+    def tick(self) -> None:
+        """Report the current playback position to the position callback.
+        
+        Called from the owner's update loop, so no dedicated tracking
+        thread is needed.
+        """
+        if self.position_callback and self.is_playing and not self.is_paused:
+            self.position_callback(self.get_position())
     
     def list_audio_files(self) -> list[str]:
         """List available audio files.
@@ -283,14 +337,7 @@ class AudioPlayer:
         Returns:
             List of audio filenames
         """
-        if not self.audio_directory.exists():
-            return []
-        
-        audio_files = []
-        for ext in ['*.mp3', '*.wav', '*.ogg']:
-            audio_files.extend([f.name for f in self.audio_directory.glob(ext)])
-        
-        return sorted(audio_files)
+        return sorted(entry.name for entry in self._scan().values())
     
     def get_audio_info(self, filename: str) -> Optional[AudioInfo]:
         """Get information about an audio file.
@@ -301,17 +348,52 @@ class AudioPlayer:
         Returns:
             Audio information or None if file not found
         """
-        file_path = self.audio_directory / filename
+        entry = self._scan().get(filename.lower())
         
-        if not file_path.exists():
+        if entry is None:
             return None
         
+        return self._entry_info(entry)
+    
+    def get_audio_infos(self, filenames: Optional[Iterable[str]] = None) -> List[AudioInfo]:
+        """Get information about several audio files from one directory scan.
+        
+        Args:
+            filenames: Names of the audio files, or None for every audio file
+            
+        Returns:
+            Audio information for each file found, in request order
+            (or sorted by name when listing every file)
+        """
+        audio_files = self._scan()
+        
+        if filenames is None:
+            entries = sorted(audio_files.values(), key=lambda entry: entry.name)
+        else:
+            entries = [audio_files.get(filename.lower()) for filename in filenames]
+        
+        infos = []
+        for entry in entries:
+            info = self._entry_info(entry) if entry is not None else None
+            if info is not None:
+                infos.append(info)
+        return infos
+    
+    def _entry_info(self, entry: os.DirEntry) -> Optional[AudioInfo]:
+        """Build audio information from a cached directory entry.
+        
+        Args:
+            entry: Directory entry from the audio directory snapshot
+            
+        Returns:
+            Audio information or None if the file can't be read
+        """
         try:
-            stat = file_path.stat()
+            stat = entry.stat()
             return AudioInfo(
-                filename=filename,
+                filename=entry.name,
                 duration=0.0,  # Would need additional library to get duration
-                format=file_path.suffix.lower(),
+                format=os.path.splitext(entry.name)[1].lower(),
                 size=stat.st_size
             )
         except OSError:
@@ -319,25 +401,37 @@ class AudioPlayer:
     
     def cleanup(self) -> None:
         """Clean up audio resources."""
+        global _MIXER_READY, _ACTIVE_PLAYERS
+        
         self.stop()
-        self._stop_position_tracking()
         
         if self.is_initialized:
-            try:
-                pygame.mixer.quit()
-            except:
-                pass
             self.is_initialized = False
+            _ACTIVE_PLAYERS -= 1
+            if _ACTIVE_PLAYERS == 0:
+                try:
+                    pygame.mixer.quit()
+                except:
+                    pass
+                _MIXER_READY = False
 
 
 class DummyAudioPlayer:
-    """Dummy audio player for when pygame is not available."""
+    """Dummy audio player for when pygame is not available.
+    
+    The dummy player is stateless, so create_audio_player hands out a single
+    shared instance.
+    """
+    
+    __slots__ = ()
+    
+    is_playing = False
+    is_paused = False
+    volume = 0.7
+    current_file = None
     
     def __init__(self, *args, **kwargs):
-        self.is_playing = False
-        self.is_paused = False
-        self.volume = 0.7
-        self.current_file = None
+        pass
     
     def is_audio_available(self) -> bool:
         return False
@@ -358,7 +452,6 @@ class DummyAudioPlayer:
         return False
     
     def set_volume(self, volume: float) -> bool:
-        self.volume = volume
         return False
     
     def get_volume(self) -> float:
@@ -367,22 +460,34 @@ class DummyAudioPlayer:
     def get_position(self) -> float:
         return 0.0
     
+    def get_position_ms(self) -> int:
+        return -1
+    
     def seek(self, position: float) -> bool:
         return False
     
     def set_position_callback(self, callback) -> None:
         pass
     
+    def tick(self) -> None:
+        pass
+    
     def list_audio_files(self) -> list[str]:
         return []
     
     def get_audio_info(self, filename: str) -> Optional[AudioInfo]:
         return None
     
+    def get_audio_infos(self, filenames=None) -> list[AudioInfo]:
+        return []
+    
     def cleanup(self) -> None:
         pass
 
 
+_DUMMY_PLAYER = DummyAudioPlayer()
+
+
 def create_audio_player(audio_directory: str = "audio") -> AudioPlayer:
     """Create an audio player instance.
     
@@ -395,4 +500,4 @@ def create_audio_player(audio_directory: str = "audio") -> AudioPlayer:
     if PYGAME_AVAILABLE:
         return AudioPlayer(audio_directory)
     else:
-        return DummyAudioPlayer(audio_directory)
\ No newline at end of file
+        return _DUMMY_PLAYER
\ No newline at end of file
@@ -3,16 +3,20 @@
 This module handles application settings, themes, and user preferences.
 """
 
-import json
+import atexit
 import os
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, Optional, Iterator
 from pathlib import Path
 from rich.style import Style
 from rich.color import Color
 
+from json_utils import dumps, loads
 
-@dataclass
+
+@dataclass(slots=True)
 class ThemeConfig:
     """Theme configuration for the karaoke player."""
     name: str
@@ -30,9 +34,43 @@ class ThemeConfig:
     panel_background: str
 
 
-@dataclass
+@dataclass(slots=True)
+class ThemeStyles:
+    """Pre-parsed Rich styles for each color of a theme.
+    
+    Parsing is done once per theme so renderers can pass Style objects
+    directly instead of having Rich re-parse color strings every frame.
+    """
+    background: Style
+    primary: Style
+    secondary: Style
+    accent: Style
+    text_primary: Style
+    text_secondary: Style
+    text_highlight: Style
+    text_active: Style
+    progress_complete: Style
+    progress_remaining: Style
+    border: Style
+    panel_background: Style
+    
+    @classmethod
+    def from_theme(cls, theme: ThemeConfig) -> "ThemeStyles":
+        """Build styles from a theme configuration.
+        
+        Args:
+            theme: Theme configuration with color strings
+            
+        Returns:
+            Parsed theme styles
+        """
+        return cls(**{field.name: Style.parse(getattr(theme, field.name)) for field in fields(cls)})
+
+
+@dataclass(slots=True)
 class DisplayConfig:
     """Display configuration settings."""
+    refresh_rate: int = 10
     show_progress_bar: bool = True
     show_time_info: bool = True
     show_next_sentence: bool = True
@@ -43,9 +81,10 @@ class DisplayConfig:
     center_current_sentence: bool = True
     show_word_count: bool = False
     show_sentence_numbers: bool = False
+    enable_animations: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     """Audio configuration settings."""
     enable_audio: bool = False
@@ -55,24 +94,63 @@ class AudioConfig:
     auto_play: bool = True
     fade_in_duration: int = 1000
     fade_out_duration: int = 1000
+    av_offset_ms: int = 0  # Lyrics timeline shift; negative delays lyrics to match output latency
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration."""
     theme: str = "default"
-    display: DisplayConfig = None
-    audio: AudioConfig = None
+    display: DisplayConfig = field(default_factory=DisplayConfig)
+    audio: AudioConfig = field(default_factory=AudioConfig)
     lyrics_directory: str = "lyrics"
     auto_save_settings: bool = True
     check_for_updates: bool = True
     language: str = "vi"
+
+
+SAVE_DEBOUNCE_SECONDS = 0.5  # Delay before coalesced setting updates are written
+
+# Field names resolved once at import so saving doesn't reflect on the dataclasses
+_APP_FIELDS = tuple(field.name for field in fields(AppConfig))
+_NESTED_FIELDS = {
+    'display': tuple(field.name for field in fields(DisplayConfig)),
+    'audio': tuple(field.name for field in fields(AudioConfig)),
+}
+_SECTION_TYPES = {'display': DisplayConfig, 'audio': AudioConfig}
+
+
+def _config_from_dict(data: Dict[str, Any]) -> AppConfig:
+    """Build the application configuration from parsed JSON data.
     
-    def __post_init__(self):
-        if self.display is None:
-            self.display = DisplayConfig()
-        if self.audio is None:
-            self.audio = AudioConfig()
+    The inverse of ConfigManager._to_dict, driven by the same precomputed
+    field names. Unknown keys are ignored and missing keys keep their
+    defaults.
+    
+    Args:
+        data: Parsed configuration file
+        
+    Returns:
+        Application configuration
+        
+    Raises:
+        TypeError: If the file or one of its sections is not a JSON object
+    """
+    if not isinstance(data, dict):
+        raise TypeError("configuration must be a JSON object")
+    
+    kwargs = {}
+    for name in _APP_FIELDS:
+        if name not in data:
+            continue
+        value = data[name]
+        nested = _NESTED_FIELDS.get(name)
+        if nested:
+            if not isinstance(value, dict):
+                raise TypeError(f"configuration section '{name}' must be a JSON object")
+            value = _SECTION_TYPES[name](**{key: value[key] for key in nested if key in value})
+        kwargs[name] = value
+    return AppConfig(**kwargs)
 
 
 class ConfigManager:
@@ -86,7 +164,17 @@ class ConfigManager:
         """
         self.config_file = Path(config_file)
         self.themes = self._load_default_themes()
+        self._theme_styles: Dict[str, ThemeStyles] = {}
+        self._last_bytes = b""
+        self._batch_depth = 0
+        self._save_pending = False
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
         self.config = self._load_config()
+        
+        # Make sure debounced updates reach the disk before exit
+        atexit.register(self.flush)
     
     def _load_default_themes(self) -> Dict[str, ThemeConfig]:
         """Load default themes.
@@ -165,23 +253,13 @@ class ConfigManager:
         """
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Convert nested dictionaries back to dataclasses
-                display_data = data.get('display', {})
-                audio_data = data.get('audio', {})
-                
-                return AppConfig(
-                    theme=data.get('theme', 'default'),
-                    display=DisplayConfig(**display_data),
-                    audio=AudioConfig(**audio_data),
-                    lyrics_directory=data.get('lyrics_directory', 'lyrics'),
-                    auto_save_settings=data.get('auto_save_settings', True),
-                    check_for_updates=data.get('check_for_updates', True),
-                    language=data.get('language', 'vi')
-                )
-            except (json.JSONDecodeError, TypeError, KeyError):
+                raw = self.config_file.read_bytes()
+                config = _config_from_dict(loads(raw))
+                # Remember the on-disk bytes so saving an unchanged
+                # configuration doesn't rewrite the file
+                self._last_bytes = raw
+                return config
+            except (ValueError, TypeError, OSError):
                 # If config is corrupted, create default
                 pass
         
@@ -192,11 +270,84 @@ class ConfigManager:
         if not self.config.auto_save_settings:
             return
         
+        if self._batch_depth:
+            self._save_pending = True
+            return
+        
+        with self._save_lock:
+            self._dirty = False
+            data = dumps(self._to_dict(), indent=True)
+            if data == self._last_bytes:
+                return  # Nothing changed since the last write
+            
+            try:
+                self.config_file.write_bytes(data)
+                self._last_bytes = data
+            except IOError:
+                pass  # Silently fail if can't save
+    
+    def _schedule_save(self) -> None:
+        """Mark the configuration dirty and save it after a short delay.
+        
+        Rapid successive updates restart the timer, so they collapse into
+        a single write.
+        """
+        if self._batch_depth:
+            self._save_pending = True
+            return
+        
+        self._dirty = True
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write pending configuration changes immediately, if any.
+        
+        Updates made through update_display_config and update_audio_config
+        are otherwise written once the debounce delay has passed.
+        """
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        if self._dirty:
+            self.save_config()
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert the current configuration to a JSON-ready dictionary.
+        
+        Equivalent to dataclasses.asdict for this fixed schema, without the
+        recursive deep copy.
+        
+        Returns:
+            Configuration dictionary in file order
+        """
+        data = {}
+        for name in _APP_FIELDS:
+            value = getattr(self.config, name)
+            nested = _NESTED_FIELDS.get(name)
+            data[name] = {key: getattr(value, key) for key in nested} if nested else value
+        return data
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving until the end of a block of configuration changes.
+        
+        Example:
+            with config_manager.batch():
+                config_manager.update_display_config(show_progress_bar=False)
+                config_manager.update_audio_config(volume=0.5)
+        """
+        self._batch_depth += 1
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.config), f, indent=2, ensure_ascii=False)
-        except IOError:
-            pass  # Silently fail if can't save
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._save_pending:
+                self._save_pending = False
+                self.save_config()
     
     def get_theme(self, theme_name: Optional[str] = None) -> ThemeConfig:
         """Get theme configuration.
@@ -212,6 +363,26 @@ class ConfigManager:
         
         return self.themes.get(theme_name, self.themes['default'])
     
+    def get_theme_styles(self, theme_name: Optional[str] = None) -> ThemeStyles:
+        """Get pre-parsed Rich styles for a theme.
+        
+        Args:
+            theme_name: Name of the theme, or None for current theme
+            
+        Returns:
+            Theme styles, parsed once and cached per theme
+        """
+        if theme_name is None:
+            theme_name = self.config.theme
+        if theme_name not in self.themes:
+            theme_name = 'default'
+        
+        styles = self._theme_styles.get(theme_name)
+        if styles is None:
+            styles = ThemeStyles.from_theme(self.themes[theme_name])
+            self._theme_styles[theme_name] = styles
+        return styles
+    
     def set_theme(self, theme_name: str) -> bool:
         """Set the current theme.
         
@@ -244,7 +415,7 @@ class ConfigManager:
         for key, value in kwargs.items():
             if hasattr(self.config.display, key):
                 setattr(self.config.display, key, value)
-        self.save_config()
+        self._schedule_save()
     
     def update_audio_config(self, **kwargs) -> None:
         """Update audio configuration.
@@ -255,7 +426,7 @@ class ConfigManager:
         for key, value in kwargs.items():
             if hasattr(self.config.audio, key):
                 setattr(self.config.audio, key, value)
-        self.save_config()
+        self._schedule_save()
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults."""
@@ -0,0 +1,49 @@
+"""JSON helpers shared by the configuration and lyrics modules.
+
+orjson is used when it is installed, falling back to the standard library.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON bytes, using orjson when available.
+
+    Args:
+        data: UTF-8 encoded JSON; with orjson, any bytes-like object such as
+            a memoryview is accepted as well
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's error
+            is a subclass)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize a value to JSON bytes, using orjson when available.
+
+    Non-ASCII text is written as UTF-8 rather than escaped.
+
+    Args:
+        data: JSON-ready value
+        indent: Whether to indent nested values by two spaces
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
@@ -6,15 +6,34 @@ song playback, timing, user interactions, and audio synchronization.
 
 import time
 import threading
-from typing import Optional, Tuple, Callable
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Callable
 from rich.console import Console
-from rich.live import Live
 
 from lyrics_data import Song, Sentence, LyricsLoader
 from layout_builder import KaraokeLayoutBuilder
-from utils import get_current_sentence, get_next_sentence, get_previous_sentence, is_song_finished
+from utils import calculate_progress_percentage, locate_sentences, SONG_END_BUFFER_MS
 from config import ConfigManager
-from audio_player import create_audio_player, AudioPlayer
+
+if TYPE_CHECKING:
+    from audio_player import AudioPlayer
+
+
+PROGRESS_STEP_MS = 250  # Granularity of progress bar updates
+COMMAND_QUEUE_SIZE = 64  # Pending playback commands kept for the render thread
+AUDIO_SYNC_GAIN = 0.1  # Fraction of the clock's drift from the audio corrected per frame
+
+# Footer status line for each (is_paused, audio_enabled) state
+FOOTER_INFO = {
+    (False, False): "🔇 Audio: OFF",
+    (False, True): "🔊 Audio: ON",
+    (True, False): "⏸️ PAUSED  🔇 Audio: OFF",
+    (True, True): "⏸️ PAUSED  🔊 Audio: ON",
+}
+
+
+def _no_op() -> None:
+    """Do nothing; stands in for audio calls when audio is disabled."""
 
 
 class KaraokePlayer:
@@ -34,12 +53,18 @@ class KaraokePlayer:
         # Playback state
         self.is_playing = False
         self.is_paused = False
-        self.start_time = 0
-        self.pause_time = 0
+        self._start_ns = 0
+        self._pause_ns = 0
+        self._offset_ns = self.config_manager.config.audio.av_offset_ms * 1_000_000
+        self._volume = self.config_manager.config.audio.volume
         self.current_song: Optional[Song] = None
         
-        # Audio support
-        self.audio_player = create_audio_player(self.config_manager.config.audio.audio_directory)
+        # Layout cache (avoids rebuilding the layout when nothing visible changed)
+        self._last_layout_key = None
+        self._cached_layout = None
+        
+        # Audio support (the player, and its backend, are created on first use)
+        self._audio_player: Optional["AudioPlayer"] = None
         self.audio_enabled = self.config_manager.config.audio.enable_audio and self.audio_player.is_audio_available()
         
         # Callbacks
@@ -48,7 +73,23 @@ class KaraokePlayer:
         
         # Threading
         self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
         self._playback_thread: Optional[threading.Thread] = None
+        # Control commands for the playback thread; deque append/popleft are
+        # thread-safe, so no lock is needed for one consumer
+        self._commands: deque = deque(maxlen=COMMAND_QUEUE_SIZE)
+    
+    @property
+    def audio_player(self) -> "AudioPlayer":
+        """Audio player, created on first access.
+        
+        Importing the audio module loads the audio backend, so it is
+        deferred until audio is actually needed.
+        """
+        if self._audio_player is None:
+            from audio_player import create_audio_player
+            self._audio_player = create_audio_player(self.config_manager.config.audio.audio_directory)
+        return self._audio_player
     
     def play_song(self, song: Song, refresh_rate: int = 10, audio_file: Optional[str] = None) -> None:
         """Play a karaoke song with synchronized lyrics display and optional audio.
@@ -61,13 +102,17 @@ class KaraokePlayer:
         self.current_song = song
         self.is_playing = True
         self.is_paused = False
-        self.start_time = time.time()
+        self._offset_ns = self.config_manager.config.audio.av_offset_ms * 1_000_000
+        self._volume = self.config_manager.config.audio.volume
+        self._start_ns = time.monotonic_ns()
         self._stop_event.clear()
+        self._wake_event.clear()
+        self._commands.clear()
         
         # Load and start audio if enabled
         if self.audio_enabled and audio_file:
             if self.audio_player.load_audio(audio_file):
-                self.audio_player.set_volume(self.config_manager.config.audio.volume)
+                self.audio_player.set_volume(self._volume)
                 self.audio_player.play()
             else:
                 if self.on_error:
@@ -75,63 +120,170 @@ class KaraokePlayer:
         
         self.console.print("[bold green]🎵 Bắt đầu phát karaoke với Rich...[/bold green]")
         self.console.print("[yellow]Nhấn Ctrl+C để dừng[/yellow]")
-        time.sleep(2)
+        self._stop_event.wait(2)
+        
+        # Render on the playback thread; control calls from other threads
+        # are queued for it instead of mutating playback state mid-frame
+        self._playback_thread = threading.Thread(
+            target=self._render_loop,
+            args=(song, refresh_rate),
+            name="karaoke-render",
+            daemon=True
+        )
+        self._playback_thread.start()
         
         try:
-            with Live(
-                self._create_initial_layout(song), 
-                refresh_per_second=refresh_rate, 
-                screen=True
-            ) as live:
-                while self.is_playing and not self._stop_event.is_set():
-                    current_time = self._get_current_time()
-                    
-                    # Update the display
-                    layout = self._create_current_layout(song, current_time)
-                    live.update(layout)
-                    
-                    # Check if song has finished
-                    if is_song_finished(song, current_time):
-                        self.console.print("[bold green]🎉 Bài hát đã kết thúc![/bold green]")
-                        if self.on_song_end:
-                            self.on_song_end()
-                        break
-                    
-                    # Small delay to control update frequency
-                    time.sleep(0.1)
-                    
+            # Join in short slices so Ctrl+C still reaches this thread
+            while self._playback_thread.is_alive():
+                self._playback_thread.join(0.1)
         except KeyboardInterrupt:
+            self.stop()
             self.console.print("[bold red]⏹️ Đã dừng karaoke[/bold red]")
         finally:
             self.stop()
     
+    def _render_loop(self, song: Song, refresh_rate: int) -> None:
+        """Run the playback thread, reporting any error that ends it.
+        
+        The error propagates out of the Live display first, so the terminal
+        is restored before it is reported through on_error.
+        
+        Args:
+            song: Song object being played
+            refresh_rate: Display refresh rate in Hz
+        """
+        try:
+            self._draw_frames(song, refresh_rate)
+        except Exception as e:
+            self._stop_event.set()
+            if self.on_error:
+                self.on_error(f"Playback stopped: {e}")
+            else:
+                self.console.print(f"[bold red]Playback stopped: {e}[/bold red]")
+    
+    def _draw_frames(self, song: Song, refresh_rate: int) -> None:
+        """Draw frames until the song ends or playback is stopped.
+        
+        Runs on the playback thread, which is the only consumer of the
+        command queue.
+        
+        Args:
+            song: Song object being played
+            refresh_rate: Display refresh rate in Hz
+        """
+        # Everything the loop touches is bound to a local up front
+        frame_interval = 1.0 / refresh_rate
+        finished_after = song.total_duration + SONG_END_BUFFER_MS
+        stopped = self._stop_event.is_set
+        wait = self._wake_event.wait
+        clear_wake = self._wake_event.clear
+        commands = self._commands
+        sync = self._sync_clock_to_audio
+        clock = self._get_current_time
+        # Only touch the audio player, which starts the mixer, when audio is on
+        tick = self.audio_player.tick if self.audio_enabled else _no_op
+        render = self._render_frame
+        next_change = self._get_next_change_time
+        
+        # Imported here so starting the menus doesn't load rich.live
+        from rich.live import Live
+        
+        # Frames are only redrawn when their content changed, so Live's
+        # own periodic refresh is disabled
+        with Live(
+            self._create_initial_layout(song), 
+            refresh_per_second=refresh_rate, 
+            auto_refresh=False,
+            screen=True
+        ) as live:
+            update = live.update
+            while not stopped():
+                # Apply control commands queued by other threads
+                while commands:
+                    command, args = commands.popleft()
+                    command(*args)
+                
+                sync()
+                current_time = clock()
+                tick()
+                
+                # Update the display if anything visible changed
+                frame_key = self._last_layout_key
+                layout = render(song, current_time)
+                if self._last_layout_key != frame_key:
+                    update(layout, refresh=True)
+                
+                # Check if song has finished
+                if current_time > finished_after:
+                    self.console.print("[bold green]🎉 Bài hát đã kết thúc![/bold green]")
+                    if self.on_song_end:
+                        self.on_song_end()
+                    break
+                
+                # Wait until the frame next changes, at most one frame so
+                # volume changes are picked up; queued commands and stop()
+                # wake the loop at once. The clock stands still while
+                # paused, so nothing changes until a command arrives
+                if self.is_paused:
+                    wait()
+                else:
+                    remaining_ms = next_change(song, current_time) - current_time
+                    wait(max(0.01, min(frame_interval, remaining_ms / 1000.0)))
+                clear_wake()
+    
+    def _submit(self, command: Callable, *args) -> None:
+        """Run a playback command on the playback thread.
+        
+        The command is queued while the render loop is running elsewhere,
+        and applied immediately otherwise.
+        
+        Args:
+            command: Method applying the change
+            *args: Arguments for the command
+        """
+        thread = self._playback_thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            self._commands.append((command, args))
+            self._wake_event.set()
+        else:
+            command(*args)
+    
     def stop(self) -> None:
         """Stop the karaoke playback and audio."""
         self.is_playing = False
         self.is_paused = False
         self._stop_event.set()
+        self._wake_event.set()
         
         if self.audio_enabled:
             self.audio_player.stop()
         
-        if self._playback_thread and self._playback_thread.is_alive():
-            self._playback_thread.join(timeout=1.0)
+        thread = self._playback_thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
     
     def pause(self) -> None:
         """Pause the karaoke playback and audio."""
+        self._submit(self._apply_pause)
+    
+    def _apply_pause(self) -> None:
+        """Pause playback; runs on the playback thread while it is alive."""
         if self.is_playing and not self.is_paused:
+            self._pause_ns = time.monotonic_ns()
             self.is_paused = True
-            self.pause_time = time.time()
             
             if self.audio_enabled:
                 self.audio_player.pause()
     
     def resume(self) -> None:
         """Resume the karaoke playback and audio."""
+        self._submit(self._apply_resume)
+    
+    def _apply_resume(self) -> None:
+        """Resume playback; runs on the playback thread while it is alive."""
         if self.is_paused:
             # Adjust start time to account for pause duration
-            pause_duration = time.time() - self.pause_time
-            self.start_time += pause_duration
+            self._start_ns += time.monotonic_ns() - self._pause_ns
             self.is_paused = False
             
             if self.audio_enabled:
@@ -143,8 +295,13 @@ class KaraokePlayer:
         Args:
             time_ms: Time to seek to in milliseconds
         """
+        self._submit(self._apply_seek, time_ms)
+    
+    def _apply_seek(self, time_ms: int) -> None:
+        """Move the playback clock; runs on the playback thread while it is alive."""
         if self.is_playing:
-            self.start_time = time.time() - (time_ms / 1000)
+            reference_ns = self._pause_ns if self.is_paused else time.monotonic_ns()
+            self._start_ns = reference_ns - time_ms * 1_000_000
             
             if self.audio_enabled:
                 self.audio_player.seek(time_ms / 1000)
@@ -152,12 +309,32 @@ class KaraokePlayer:
     def _get_current_time(self) -> int:
         """Get current playback time in milliseconds.
         
+        The audio/video sync offset is folded into the same subtraction.
+        
         Returns:
             Current time in milliseconds
         """
         if self.is_paused:
-            return int((self.pause_time - self.start_time) * 1000)
-        return int((time.time() - self.start_time) * 1000)
+            return (self._pause_ns - self._start_ns + self._offset_ns) // 1_000_000
+        return (time.monotonic_ns() - self._start_ns + self._offset_ns) // 1_000_000
+    
+    def _sync_clock_to_audio(self) -> None:
+        """Nudge the playback clock toward the audio device's position.
+        
+        The monotonic clock stays the time source, so highlighting moves
+        smoothly, but a fraction of its error against the position reported
+        by the audio device is corrected on every frame. Render stalls and
+        device clock skew then can't accumulate into drift.
+        """
+        if not self.audio_enabled or self.is_paused or not self.audio_player.is_playing:
+            return
+        
+        audio_ms = self.audio_player.get_position_ms()
+        if audio_ms < 0:
+            return
+        
+        error_ms = audio_ms - (time.monotonic_ns() - self._start_ns) // 1_000_000
+        self._start_ns -= int(error_ms * AUDIO_SYNC_GAIN * 1_000_000)
     
     def _get_current_time_ms(self) -> int:
         """Get current playback time in milliseconds (alias for consistency)."""
@@ -169,11 +346,15 @@ class KaraokePlayer:
         Args:
             volume: Volume level (0.0 to 1.0)
         """
+        self._submit(self._apply_volume, volume)
+    
+    def _apply_volume(self, volume: float) -> None:
+        """Change the volume; runs on the playback thread while it is alive."""
         if self.audio_enabled:
             self.audio_player.set_volume(volume)
         
-        if self.config_manager:
-            self.config_manager.config.audio.volume = volume
+        self._volume = volume
+        self.config_manager.config.audio.volume = volume
     
     def get_volume(self) -> float:
         """Get current audio volume.
@@ -191,7 +372,7 @@ class KaraokePlayer:
         Returns:
             Current position in milliseconds
         """
-        return self._get_current_time_ms()
+        return self._get_current_time()
     
     def get_song_duration(self) -> int:
         """Get total song duration in milliseconds.
@@ -199,15 +380,10 @@ class KaraokePlayer:
         Returns:
             Song duration in milliseconds, or 0 if no song loaded
         """
-        if not self.current_song or not self.current_song.sentences:
+        if not self.current_song:
             return 0
         
-        # Find the last word's end time
-        last_sentence = list(self.current_song.sentences.values())[-1]
-        if last_sentence.words:
-            last_word = last_sentence.words[-1]
-            return last_word.end_time
-        return 0
+        return self.current_song.total_duration
     
     def is_audio_enabled(self) -> bool:
         """Check if audio is enabled.
@@ -231,47 +407,6 @@ class KaraokePlayer:
         
         return self.audio_enabled
     
-    def _create_current_layout(self, current_time_ms: int):
-        """Create the current karaoke layout.
-        
-        Args:
-            current_time_ms: Current time in milliseconds
-            
-        Returns:
-            Rich layout for the current state
-        """
-        if not self.current_song:
-            return self.layout_builder.create_error_panel("No song loaded")
-        
-        # Get current and next sentences
-        current_key, current_sentence = get_current_sentence(self.current_song, current_time_ms)
-        next_key, next_sentence = get_next_sentence(self.current_song, current_time_ms)
-        previous_key, previous_sentence = get_previous_sentence(self.current_song, current_time_ms)
-        
-        # Get audio info if available
-        audio_enabled = self.audio_enabled
-        volume = self.config_manager.config.audio.volume if self.config_manager else 0.7
-        
-        # Additional info for footer
-        additional_info = []
-        if self.is_paused:
-            additional_info.append("⏸️ PAUSED")
-        if audio_enabled:
-            additional_info.append(f"🔊 Audio: ON")
-        else:
-            additional_info.append(f"🔇 Audio: OFF")
-        
-        return self.layout_builder.create_karaoke_layout(
-            song=self.current_song,
-            current_time_ms=current_time_ms,
-            current_sentence=current_sentence,
-            next_sentence=next_sentence,
-            previous_sentence=previous_sentence,
-            audio_enabled=audio_enabled,
-            volume=volume,
-            additional_info=additional_info
-        )
-    
     def _create_initial_layout(self, song: Song):
         """Create the initial layout for the song.
         
@@ -281,11 +416,17 @@ class KaraokePlayer:
         Returns:
             Initial Rich layout
         """
-        return self._create_current_layout(song, 0)
+        return self._render_frame(song, 0)
     
-    def _create_current_layout(self, song: Song, current_time: int):
+    def _render_frame(self, song: Song, current_time: int):
         """Create the current layout based on playback time.
         
+        The full layout is only rebuilt when the visible sentences or the
+        playback state change; otherwise the cached layout is reused. The
+        lyrics section is only refreshed when a word changes state, and the
+        progress section when the progress bar advances, at most every
+        PROGRESS_STEP_MS.
+        
         Args:
             song: Song object
             current_time: Current playback time in milliseconds
@@ -293,35 +434,101 @@ class KaraokePlayer:
         Returns:
             Rich layout for current state
         """
-        # Get current and next sentences
-        _, current_sentence = get_current_sentence(song, current_time)
-        _, next_sentence = get_next_sentence(song, current_time)
-        _, previous_sentence = get_previous_sentence(song, current_time)
+        # Get previous, current and next sentences
+        ((previous_key, previous_sentence), (current_key, current_sentence),
+         (next_key, next_sentence)) = locate_sentences(song, current_time)
         
         # Get audio info if available
         audio_enabled = self.audio_enabled
-        volume = self.config_manager.config.audio.volume if self.config_manager else 0.7
-        
-        # Additional info for footer
-        additional_info = []
-        if self.is_paused:
-            additional_info.append("⏸️ PAUSED")
-        if audio_enabled:
-            additional_info.append(f"🔊 Audio: ON")
-        else:
-            additional_info.append(f"🔇 Audio: OFF")
-        
-        # Create and return the layout
-        return self.layout_builder.create_karaoke_layout(
+        volume = self._volume
+        
+        # Volume is keyed at the header's display precision, so changes that
+        # don't alter the shown percentage don't trigger a redraw
+        sentence_key = (id(song), previous_key, current_key, next_key, self.is_paused,
+                        audio_enabled, int(volume * 100), self.config_manager.config.theme)
+        word_state = (self.layout_builder.get_word_state(previous_sentence, current_time),
+                      self.layout_builder.get_word_state(current_sentence, current_time))
+        if self._has_active_words(word_state):
+            # Active words follow the pulse animation
+            word_state += (self.layout_builder.is_pulsing(current_time),)
+        layout_key = (sentence_key, current_time // PROGRESS_STEP_MS, word_state)
+        
+        if self._cached_layout is not None and self._last_layout_key is not None:
+            if layout_key == self._last_layout_key:
+                return self._cached_layout
+            
+            last_sentence_key, last_progress_step, last_word_state = self._last_layout_key
+            if sentence_key == last_sentence_key:
+                # Only the playback position moved: refresh just the
+                # time-dependent sections whose input changed
+                if layout_key[1] != last_progress_step:
+                    self.layout_builder.update_progress(self._cached_layout, current_time, song.total_duration)
+                if word_state != last_word_state:
+                    self.layout_builder.update_lyrics(
+                        self._cached_layout, current_sentence, next_sentence,
+                        previous_sentence, current_time
+                    )
+                self._last_layout_key = layout_key
+                return self._cached_layout
+        
+        # Update the shared layout and cache it
+        self._cached_layout = self.layout_builder.update_karaoke_layout(
             song=song,
-            current_time_ms=current_time,
             current_sentence=current_sentence,
             next_sentence=next_sentence,
             previous_sentence=previous_sentence,
+            current_time=current_time,
+            total_duration=song.total_duration,
             audio_enabled=audio_enabled,
             volume=volume,
-            additional_info=additional_info
+            additional_info=FOOTER_INFO[self.is_paused, audio_enabled]
         )
+        self._last_layout_key = layout_key
+        return self._cached_layout
+    
+    def _get_next_change_time(self, song: Song, current_time: int) -> int:
+        """Get the playback time at which the rendered frame next changes.
+        
+        Args:
+            song: Song object
+            current_time: Current playback time in milliseconds
+            
+        Returns:
+            Time in milliseconds of the next word, sentence, animation or
+            progress change
+        """
+        ((_, previous_sentence), (_, current_sentence),
+         (_, next_sentence)) = locate_sentences(song, current_time)
+        
+        changes = [(current_time // PROGRESS_STEP_MS + 1) * PROGRESS_STEP_MS]
+        if next_sentence:
+            changes.append(next_sentence.start_time)
+        if current_sentence:
+            changes.append(current_sentence.end_time + 1)
+        word_state = []
+        for sentence in (previous_sentence, current_sentence):
+            change = self.layout_builder.get_next_word_change(sentence, current_time)
+            if change is not None:
+                changes.append(change)
+            word_state.append(self.layout_builder.get_word_state(sentence, current_time))
+        if self._has_active_words(word_state):
+            change = self.layout_builder.get_next_animation_change(current_time)
+            if change is not None:
+                changes.append(change)
+        return min(changes)
+    
+    @staticmethod
+    def _has_active_words(word_state) -> bool:
+        """Check whether any sentence of a frame has words being sung.
+        
+        Args:
+            word_state: (sung, started) word states of the frame's sentences,
+                None for missing sentences
+            
+        Returns:
+            True if at least one word is highlighted as active
+        """
+        return any(state is not None and state[0] < state[1] for state in word_state)
     
     def get_playback_info(self, song: Song) -> dict:
         """Get current playback information.
@@ -340,14 +547,14 @@ class KaraokePlayer:
             }
         
         current_time = self._get_current_time()
-        progress = (current_time / song.total_duration) * 100 if song.total_duration > 0 else 0
+        _, (current_key, _), (next_key, _) = locate_sentences(song, current_time)
         
         return {
             'is_playing': self.is_playing,
             'current_time': current_time,
-            'progress_percentage': min(100.0, max(0.0, progress)),
-            'current_sentence': get_current_sentence(song, current_time)[0],
-            'next_sentence': get_next_sentence(song, current_time)[0]
+            'progress_percentage': calculate_progress_percentage(current_time, song.total_duration),
+            'current_sentence': current_key,
+            'next_sentence': next_key
         }
 
 
@@ -4,27 +4,64 @@ This module handles all Rich UI components and rendering logic,
 including styled text, progress bars, and panel layouts with theme support.
 """
 
-from typing import List, Optional, Tuple, Dict, Any
-from rich.console import Console
-from rich.layout import Layout
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Dict, Any
+from rich.console import Console, RenderableType
 from rich.panel import Panel
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.table import Table
+from rich.text import Text, Span
 from rich.align import Align
 from rich.console import Group
-from rich.rule import Rule
-from rich.columns import Columns
 from rich.box import ROUNDED, DOUBLE, HEAVY, MINIMAL
 from rich.style import Style
-from rich.padding import Padding
-from rich.emoji import Emoji
+from rich.errors import StyleSyntaxError
 
-from lyrics_data import Song, Sentence, Word
-from utils import format_time, is_word_active, calculate_progress_percentage
+if TYPE_CHECKING:
+    # Tables are only built by menu screens and layouts only during
+    # playback, so rich.table and rich.layout are imported lazily
+    from rich.layout import Layout
+    from rich.table import Table
+
+from lyrics_data import Song, Sentence, SongMenuEntry, Word
+from utils import format_time, get_active_word_range
 from config import ConfigManager, ThemeConfig
 
 
+BOLD = Style(bold=True)
+DIM = Style(dim=True)
+QUIT_STYLE = Style(color="bright_red")
+PULSE = Style(underline=True)
+LYRICS_CACHE_SIZE = 128  # Styled sentence texts kept between frames
+PANEL_CACHE_SIZE = 32  # Static panels kept per theme
+ANIMATION_STEP_MS = 100  # Duration of one pulse animation frame
+PULSE_CYCLE = 20  # Animation frames per pulse, ramping up then down
+PULSE_WINDOW = (6, 15)  # Frames of each cycle showing the pulse style
+TITLES = {
+    "header": ("🎵 Now Playing", "accent"),
+    "progress": ("⏱️ Progress", "accent"),
+    "lyrics": ("📝 Lyrics", "accent"),
+    "previous": ("Previous", "text_secondary"),
+    "current": ("♪ Current", "accent"),
+    "next": ("Next", "primary"),
+    "footer": ("🎮 Controls", "accent"),
+    "songs": ("🎵 Available Songs", "accent"),
+    "welcome": ("🎵 Karaoke Rich", "accent"),
+    "themes": ("🎨 Theme Selection", "accent"),
+    "loading": ("⏳ Loading", "accent"),
+    "song_info": ("📊 Song Information", "accent"),
+}
+CONTROLS = (
+    ("[SPACE]", "Pause/Resume", "accent"),
+    ("[Q]", "Quit", None),
+    ("[R]", "Restart", "primary"),
+    ("[T]", "Theme", "secondary"),
+    ("[+/-]", "Volume", "text_secondary"),
+)
+PROGRESS_LABEL = "Progress "
+PROGRESS_BAR_WIDTH = 40
+PROGRESS_BAR = "━" * PROGRESS_BAR_WIDTH
+
+
 class KaraokeLayoutBuilder:
     """Builds Rich UI layouts for the karaoke player with theme support."""
     
@@ -38,40 +75,191 @@ class KaraokeLayoutBuilder:
         self.console = console
         self.config_manager = config_manager or ConfigManager()
         self.theme = self.config_manager.get_theme()
+        self.styles = self.config_manager.get_theme_styles()
         self.display_config = self.config_manager.config.display
+        self._active_styles = self._build_active_styles()
+        self._controls_text = self._build_controls_text()
+        self._titles = self._build_titles()
+        
+        # Reusable karaoke layout tree
+        self._layout: Optional[Layout] = None
+        self._layout_show_progress: Optional[bool] = None
+        self._section_keys: Dict[str, Any] = {}
+        
+        # Reusable progress bar, rebuilt only when the theme changes
+        self._progress_text: Optional[Text] = None
+        self._progress_panel: Optional[Panel] = None
+        self._progress_key: Optional[int] = None
+        self._progress_state: Optional[Tuple] = None
+        
+        # Least recently used styled texts, keyed by sentence, role and word
+        # state; each entry keeps its sentence to guard against id() reuse
+        self._lyrics_cache: "OrderedDict[Tuple[int, bool, Tuple], Tuple[Sentence, Text]]" = OrderedDict()
+        
+        # Panels and tables that only depend on their arguments and the theme
+        self._panel_cache: Dict[Tuple, RenderableType] = {}
+    
+    def _cached_panel(self, key: Tuple, build: Callable[[], RenderableType]) -> RenderableType:
+        """Get a panel or table from the panel cache, building it on a miss.
         
-        # Animation states
-        self._animation_frame = 0
-        self._pulse_direction = 1
+        Args:
+            key: Tuple identifying the content for the current theme
+            build: Function creating the panel or table
+            
+        Returns:
+            The cached or newly built renderable
+        """
+        panel = self._panel_cache.get(key)
+        if panel is None:
+            if len(self._panel_cache) >= PANEL_CACHE_SIZE:
+                self._panel_cache.clear()
+            panel = self._panel_cache[key] = build()
+        return panel
     
-    def _get_animated_style(self, base_color: str) -> str:
-        """Get animated style for active text.
+    def _build_titles(self) -> Dict[str, Text]:
+        """Style the panel titles for the current theme.
+        
+        Returns:
+            Dictionary mapping title names from TITLES to styled Text
+        """
+        return {
+            name: Text(title, style=getattr(self.styles, style_name))
+            for name, (title, style_name) in TITLES.items()
+        }
+    
+    def _build_active_styles(self) -> Tuple[Style, Style]:
+        """Parse the active word styles for the current theme.
+        
+        Returns:
+            Tuple of (normal, pulse) styles; the pulse style uses the bright
+            variant of the active color, or underlines the word when the
+            color has none
+        """
+        normal = self.styles.text_active + BOLD
+        try:
+            pulse = Style.parse(f"bright_{self.theme.text_active}") + BOLD
+        except StyleSyntaxError:
+            pulse = normal + PULSE
+        return normal, pulse
+    
+    def is_pulsing(self, current_time: int) -> bool:
+        """Check whether active words show the pulse style at a given time.
+        
+        The animation advances with playback time, one frame every
+        ANIMATION_STEP_MS, so every line rendered for a frame shares the
+        same phase however often it is rendered.
+        
+        Args:
+            current_time: Current playback time in milliseconds
+            
+        Returns:
+            True if animations are enabled and the pulse is showing
+        """
+        if not self.display_config.enable_animations:
+            return False
+        frame = current_time // ANIMATION_STEP_MS % PULSE_CYCLE
+        return PULSE_WINDOW[0] <= frame < PULSE_WINDOW[1]
+    
+    def get_next_animation_change(self, current_time: int) -> Optional[int]:
+        """Get when the pulse animation next switches style.
         
         Args:
-            base_color: Base color for animation
+            current_time: Current playback time in milliseconds
             
         Returns:
-            Animated style string
+            Time in milliseconds of the next switch, or None if animations
+            are disabled
         """
         if not self.display_config.enable_animations:
-            return base_color
-        
-        # Simple pulse animation
-        self._animation_frame += self._pulse_direction
-        if self._animation_frame >= 10:
-            self._pulse_direction = -1
-        elif self._animation_frame <= 0:
-            self._pulse_direction = 1
-        
-        # Create pulsing effect
-        if self._animation_frame > 5:
-            return f"bright_{base_color}"
+            return None
+        step = current_time // ANIMATION_STEP_MS
+        frame = step % PULSE_CYCLE
+        if frame < PULSE_WINDOW[0]:
+            next_frame = PULSE_WINDOW[0]
+        elif frame < PULSE_WINDOW[1]:
+            next_frame = PULSE_WINDOW[1]
         else:
-            return base_color
+            next_frame = PULSE_CYCLE + PULSE_WINDOW[0]
+        return (step - frame + next_frame) * ANIMATION_STEP_MS
+    
+    def _get_animated_style(self, current_time: int) -> Style:
+        """Get animated style for active text.
+        
+        Args:
+            current_time: Current playback time in milliseconds
+            
+        Returns:
+            One of the theme's pre-parsed active styles
+        """
+        normal, pulse = self._active_styles
+        return pulse if self.is_pulsing(current_time) else normal
+    
+    def _get_lyrics_layout(self, sentence: Sentence) -> Tuple[str, array, array, array]:
+        """Get the plain text and word positions of a sentence.
+        
+        All four are computed once when the sentence is created.
+        
+        Args:
+            sentence: Sentence object containing words
+            
+        Returns:
+            Tuple of (plain text, word start offsets, word end offsets, packed word times)
+        """
+        return sentence.plain_text, sentence.word_starts, sentence.word_ends, sentence.word_times
+    
+    def get_word_state(self, sentence: Optional[Sentence], current_time: int) -> Optional[Tuple[int, int]]:
+        """Get how far word highlighting has advanced in a sentence.
+        
+        Words before the first index have finished their highlight, words
+        before the second have been reached; the ones in between are active.
+        
+        Args:
+            sentence: Sentence object containing words
+            current_time: Current playback time in milliseconds
+            
+        Returns:
+            Tuple of (sung word count, reached word count), or None if there
+            are no words
+        """
+        if not sentence or not sentence.words:
+            return None
+        
+        return get_active_word_range(sentence, current_time, self.display_config.highlight_duration)
+    
+    def get_next_word_change(self, sentence: Optional[Sentence], current_time: int) -> Optional[int]:
+        """Get when the word highlighting of a sentence next changes.
+        
+        Args:
+            sentence: Sentence object containing words
+            current_time: Current playback time in milliseconds
+            
+        Returns:
+            Time in milliseconds of the next word state change, or None if
+            the state no longer changes
+        """
+        state = self.get_word_state(sentence, current_time)
+        if state is None:
+            return None
+        
+        sung, started = state
+        times = sentence.word_times
+        changes = []
+        if started < len(times):
+            changes.append(times[started])
+        if sung < started:
+            changes.append(times[sung] + self.display_config.highlight_duration + 1)
+        return min(changes) if changes else None
     
     def create_lyrics_text(self, sentence: Sentence, current_time: int, is_current: bool = True) -> Text:
         """Create styled text for a sentence with word-by-word highlighting.
         
+        Words are sorted by time, so the sung, active and future words form
+        three consecutive runs found by binary search, and the text is styled
+        with one span per run. Texts are kept in a bounded LRU cache keyed
+        by the word state, so a line is only styled again when one of its
+        words changes state. The returned Text is shared and must be treated
+        as read-only.
+        
         Args:
             sentence: Sentence object containing words
             current_time: Current playback time in milliseconds
@@ -83,33 +271,44 @@ class KaraokeLayoutBuilder:
         if not sentence or not sentence.words:
             return Text("")
         
-        text = Text()
-        
-        for i, word in enumerate(sentence.words):
-            # Add space before word (except first word)
-            if i > 0:
-                text.append(" ")
-            
-            # Determine word styling based on timing and theme
-            if is_word_active(word.time, current_time, self.display_config.highlight_duration):
-                # Currently active word with animation
-                style = self._get_animated_style(self.theme.text_active)
-                text.append(word.text, style=f"bold {style}")
-            elif word.time <= current_time:
-                # Already sung word
-                text.append(word.text, style=self.theme.text_highlight)
-            else:
-                # Future word
-                if is_current:
-                    text.append(word.text, style=self.theme.text_primary)
-                else:
-                    text.append(word.text, style=self.theme.text_secondary)
-        
+        plain, starts, ends, times = self._get_lyrics_layout(sentence)
+        sung, started = self.get_word_state(sentence, current_time)
+        active_style = self._get_animated_style(current_time) if sung < started else None
+        
+        cache = self._lyrics_cache
+        cache_key = (id(sentence), is_current, (sung, started, active_style))
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] is sentence:
+            cache.move_to_end(cache_key)
+            return cached[1]
+        
+        styles = self.styles
+        spans = []
+        if sung:
+            # Already sung words
+            spans.append(Span(0, ends[sung - 1], styles.text_highlight))
+        if active_style:
+            # Currently active words with animation
+            spans.append(Span(starts[sung], ends[started - 1], active_style))
+        if started < len(times):
+            # Future words
+            future_style = styles.text_primary if is_current else styles.text_secondary
+            spans.append(Span(starts[started], len(plain), future_style))
+        text = Text(plain, spans=spans)
+        
+        cache[cache_key] = (sentence, text)
+        cache.move_to_end(cache_key)
+        if len(cache) > LYRICS_CACHE_SIZE:
+            cache.popitem(last=False)
         return text
     
     def create_progress_bar(self, current_time: int, total_duration: int) -> Panel:
         """Create a themed progress bar showing song progress.
         
+        The bar is a single Text drawn with integer arithmetic. It and its
+        panel are built once per theme and the text is rewritten in place
+        when its content changes.
+        
         Args:
             current_time: Current playback time in milliseconds
             total_duration: Total song duration in milliseconds
@@ -119,39 +318,54 @@ class KaraokeLayoutBuilder:
         """
         if not self.display_config.show_progress_bar:
             return Panel("", height=0)
-            
-        if total_duration <= 0:
-            percentage = 0.0
-        else:
-            percentage = calculate_progress_percentage(current_time, total_duration)
-        
-        # Create themed progress bar
-        progress = Progress(
-            SpinnerColumn("dots", style=self.theme.accent),
-            TextColumn(f"[{self.theme.primary}]Progress"),
-            BarColumn(
-                bar_width=40,
-                complete_style=self.theme.progress_complete,
-                finished_style=self.theme.progress_complete,
-                pulse_style=self.theme.accent
-            ),
-            TextColumn(f"[{self.theme.primary}]{{task.percentage:>3.0f}}%"),
-        )
         
-        if self.display_config.show_time_info:
-            progress.columns.append(
-                TextColumn(f"[{self.theme.text_secondary}]{format_time(current_time)} / {format_time(total_duration)}")
+        styles = self.styles
+        titles = self._titles
+        if self._progress_panel is None or self._progress_key != id(styles):
+            self._progress_text = Text()
+            self._progress_panel = Panel(
+                self._progress_text,
+                title=titles["progress"],
+                border_style=styles.border,
+                box=ROUNDED,
+                padding=(0, 1)
             )
+            self._progress_key = id(styles)
+            self._progress_state = None
         
-        task = progress.add_task("progress", total=100, completed=percentage)
+        if total_duration > 0:
+            position = min(max(current_time, 0), total_duration)
+            filled = position * PROGRESS_BAR_WIDTH // total_duration
+            percent = position * 100 // total_duration
+        else:
+            position = filled = percent = 0
+        
+        # The text only changes when the bar, the percentage or the shown
+        # second does
+        show_time_info = self.display_config.show_time_info
+        state = (filled, percent, position // 1000, total_duration, show_time_info)
+        if state == self._progress_state:
+            return self._progress_panel
+        self._progress_state = state
+        
+        bar_start = len(PROGRESS_LABEL)
+        bar_end = bar_start + PROGRESS_BAR_WIDTH
+        plain = f"{PROGRESS_LABEL}{PROGRESS_BAR} {percent:>3}%"
+        spans = [
+            Span(0, bar_start, styles.primary),
+            Span(bar_start, bar_start + filled, styles.progress_complete),
+            Span(bar_start + filled, bar_end, styles.progress_remaining),
+            Span(bar_end + 1, len(plain), styles.primary),
+        ]
         
-        return Panel(
-            progress,
-            title=f"[{self.theme.accent}]⏱️ Progress",
-            border_style=self.theme.border,
-            box=ROUNDED,
-            padding=(0, 1)
-        )
+        if show_time_info:
+            time_start = len(plain) + 1
+            plain += f" {format_time(position)} / {format_time(total_duration)}"
+            spans.append(Span(time_start, len(plain), styles.text_secondary))
+        
+        self._progress_text.plain = plain
+        self._progress_text.spans = spans
+        return self._progress_panel
     
     def create_header_panel(self, song: Song, audio_enabled: bool = False, volume: float = 0.7) -> Panel:
         """Create themed header panel with song information.
@@ -164,34 +378,45 @@ class KaraokeLayoutBuilder:
         Returns:
             Rich Panel with song information
         """
+        key = ("header", song.title, song.artist, audio_enabled, int(volume * 10), int(volume * 100))
+        return self._cached_panel(key, lambda: self._build_header_panel(song, audio_enabled, volume))
+    
+    def _build_header_panel(self, song: Song, audio_enabled: bool, volume: float) -> Panel:
+        """Build the header panel for create_header_panel.
+        
+        Args:
+            song: Song object containing metadata
+            audio_enabled: Whether audio is currently enabled
+            volume: Current volume level (0.0 to 1.0)
+            
+        Returns:
+            Rich Panel with song information
+        """
+        # Title and audio status share one centered Text, one line each
+        header_text = Text(justify="center")
+        
         # Main title
-        header_text = Text()
-        header_text.append("🎤 ", style=self.theme.accent)
-        header_text.append(song.title, style=f"bold {self.theme.text_primary}")
-        header_text.append(" by ", style=self.theme.text_secondary)
-        header_text.append(song.artist, style=self.theme.secondary)
+        header_text.append("🎤 ", style=self.styles.accent)
+        header_text.append(song.title, style=self.styles.text_primary + BOLD)
+        header_text.append(" by ", style=self.styles.text_secondary)
+        header_text.append(song.artist, style=self.styles.secondary)
+        header_text.append("\n")
         
         # Audio status
         if audio_enabled:
             volume_bars = "█" * int(volume * 10)
             volume_empty = "░" * (10 - int(volume * 10))
-            audio_status = Text()
-            audio_status.append("🔊 ", style=self.theme.accent)
-            audio_status.append(volume_bars, style=self.theme.progress_complete)
-            audio_status.append(volume_empty, style=self.theme.text_secondary)
-            audio_status.append(f" {int(volume * 100)}%", style=self.theme.text_secondary)
+            header_text.append("🔊 ", style=self.styles.accent)
+            header_text.append(volume_bars, style=self.styles.progress_complete)
+            header_text.append(volume_empty, style=self.styles.text_secondary)
+            header_text.append(f" {int(volume * 100)}%", style=self.styles.text_secondary)
         else:
-            audio_status = Text("🔇 Audio Disabled", style=self.theme.text_secondary)
-        
-        content = Group(
-            Align.center(header_text),
-            Align.center(audio_status)
-        )
+            header_text.append("🔇 Audio Disabled", style=self.styles.text_secondary)
         
         return Panel(
-            content,
-            title=f"[{self.theme.accent}]🎵 Now Playing",
-            border_style=self.theme.border,
+            header_text,
+            title=self._titles["header"],
+            border_style=self.styles.border,
             box=ROUNDED,
             padding=(1, 2)
         )
@@ -211,17 +436,20 @@ class KaraokeLayoutBuilder:
         Returns:
             Rich Panel with lyrics
         """
+        styles = self.styles
+        titles = self._titles
+        display_config = self.display_config
         content = []
         
         # Previous sentence (if enabled and available)
-        if (self.display_config.show_previous_sentence and 
+        if (display_config.show_previous_sentence and 
             previous_sentence and 
-            len(content) < self.display_config.max_visible_sentences):
+            len(content) < display_config.max_visible_sentences):
             prev_text = self.create_lyrics_text(previous_sentence, current_time, is_current=False)
             content.append(Panel(
                 Align.center(prev_text),
-                title=f"[{self.theme.text_secondary}]Previous",
-                border_style=self.theme.text_secondary,
+                title=titles["previous"],
+                border_style=styles.text_secondary,
                 box=MINIMAL,
                 padding=(0, 1)
             ))
@@ -231,32 +459,32 @@ class KaraokeLayoutBuilder:
             current_text = self.create_lyrics_text(current_sentence, current_time, is_current=True)
             content.append(Panel(
                 Align.center(current_text),
-                title=f"[{self.theme.accent}]♪ Current",
-                border_style=self.theme.accent,
+                title=titles["current"],
+                border_style=styles.accent,
                 box=ROUNDED,
                 padding=(1, 2)
             ))
         
         # Next sentence (if enabled and available)
-        if (self.display_config.show_next_sentence and 
+        if (display_config.show_next_sentence and 
             next_sentence and 
-            len(content) < self.display_config.max_visible_sentences):
+            len(content) < display_config.max_visible_sentences):
             next_text = self.create_lyrics_text(next_sentence, current_time, is_current=False)
             content.append(Panel(
                 Align.center(next_text),
-                title=f"[{self.theme.primary}]Next",
-                border_style=self.theme.primary,
+                title=titles["next"],
+                border_style=styles.primary,
                 box=MINIMAL,
                 padding=(0, 1)
             ))
         
         if not content:
-            content.append(Text("🎵 No lyrics available", style=f"dim {self.theme.text_secondary}"))
+            content.append(Text("🎵 No lyrics available", style=styles.text_secondary + DIM))
         
         return Panel(
             Group(*content),
-            title=f"[{self.theme.accent}]📝 Lyrics",
-            border_style=self.theme.border,
+            title=titles["lyrics"],
+            border_style=styles.border,
             box=ROUNDED,
             padding=(0, 1)
         )
@@ -270,61 +498,58 @@ class KaraokeLayoutBuilder:
         Returns:
             Rich Panel with control instructions
         """
-        # Controls
-        controls = [
-            ("[SPACE]", "Pause/Resume", self.theme.accent),
-            ("[Q]", "Quit", "bright_red"),
-            ("[R]", "Restart", self.theme.primary),
-            ("[T]", "Theme", self.theme.secondary),
-            ("[+/-]", "Volume", self.theme.text_secondary)
-        ]
+        return self._cached_panel(("footer", additional_info),
+                                  lambda: self._build_footer_panel(additional_info))
+    
+    def _build_controls_text(self) -> Text:
+        """Build the controls line shown in the footer for the current theme.
         
+        Returns:
+            Rich Text listing the control keys
+        """
         controls_text = Text()
-        controls_text.append("Controls: ", style=f"bold {self.theme.text_primary}")
+        controls_text.append("Controls: ", style=self.styles.text_primary + BOLD)
         
-        for i, (key, action, color) in enumerate(controls):
+        for i, (key, action, style_name) in enumerate(CONTROLS):
             if i > 0:
                 controls_text.append("  ", style="white")
-            controls_text.append(key, style=f"bold {color}")
-            controls_text.append(f" {action}", style=self.theme.text_secondary)
+            color = getattr(self.styles, style_name) if style_name else QUIT_STYLE
+            controls_text.append(key, style=color + BOLD)
+            controls_text.append(f" {action}", style=self.styles.text_secondary)
+        return controls_text
+    
+    def _build_footer_panel(self, additional_info: Optional[str]) -> Panel:
+        """Build the footer panel for create_footer_panel.
         
-        content = [controls_text]
+        Args:
+            additional_info: Optional additional information to display
+            
+        Returns:
+            Rich Panel with control instructions
+        """
+        content = [self._controls_text]
         
         # Additional info
         if additional_info:
-            info_text = Text(additional_info, style=self.theme.text_secondary)
+            info_text = Text(additional_info, style=self.styles.text_secondary)
             content.append(info_text)
         
         return Panel(
             Align.center(Group(*content)),
-            title=f"[{self.theme.accent}]🎮 Controls",
-            border_style=self.theme.border,
+            title=self._titles["footer"],
+            border_style=self.styles.border,
             box=ROUNDED,
             padding=(0, 1)
         )
     
-    def create_karaoke_layout(self, song: Song, current_sentence: Optional[Sentence],
-                             next_sentence: Optional[Sentence], 
-                             previous_sentence: Optional[Sentence],
-                             current_time: int, total_duration: int,
-                             audio_enabled: bool = False, volume: float = 0.7,
-                             additional_info: Optional[str] = None) -> Layout:
-        """Create the complete themed karaoke layout.
+    def _build_layout_skeleton(self) -> "Layout":
+        """Create the empty karaoke layout with its named sections.
         
-        Args:
-            song: Song object with metadata
-            current_sentence: Currently active sentence
-            next_sentence: Next sentence to be sung
-            previous_sentence: Previous sentence that was sung
-            current_time: Current playback time in milliseconds
-            total_duration: Total song duration in milliseconds
-            audio_enabled: Whether audio is currently enabled
-            volume: Current volume level
-            additional_info: Additional information to display
-            
         Returns:
-            Rich Layout object
+            Rich Layout split into header, optional progress, main and footer
         """
+        from rich.layout import Layout
+        
         layout = Layout()
         
         # Dynamic layout based on configuration
@@ -347,54 +572,193 @@ class KaraokeLayoutBuilder:
                 layout_args.append(Layout(name=name, size=size))
         
         layout.split_column(*layout_args)
+        return layout
+    
+    def _populate_layout(self, layout: "Layout", song: Song, current_sentence: Optional[Sentence],
+                         next_sentence: Optional[Sentence],
+                         previous_sentence: Optional[Sentence],
+                         current_time: int, total_duration: int,
+                         audio_enabled: bool, volume: float,
+                         additional_info: Optional[str]) -> None:
+        """Fill every section of a karaoke layout skeleton.
         
-        # Populate sections
+        Args:
+            layout: Layout created by _build_layout_skeleton
+            song: Song object with metadata
+            current_sentence: Currently active sentence
+            next_sentence: Next sentence to be sung
+            previous_sentence: Previous sentence that was sung
+            current_time: Current playback time in milliseconds
+            total_duration: Total song duration in milliseconds
+            audio_enabled: Whether audio is currently enabled
+            volume: Current volume level
+            additional_info: Additional information to display
+        """
         layout["header"].update(self.create_header_panel(song, audio_enabled, volume))
-        layout["main"].update(self.create_lyrics_panel(
-            current_sentence, next_sentence, previous_sentence, current_time
-        ))
+        self.update_lyrics(layout, current_sentence, next_sentence, previous_sentence, current_time)
+        self.update_progress(layout, current_time, total_duration)
+        layout["footer"].update(self.create_footer_panel(additional_info))
+    
+    def create_karaoke_layout(self, song: Song, current_sentence: Optional[Sentence],
+                             next_sentence: Optional[Sentence], 
+                             previous_sentence: Optional[Sentence],
+                             current_time: int, total_duration: int,
+                             audio_enabled: bool = False, volume: float = 0.7,
+                             additional_info: Optional[str] = None) -> "Layout":
+        """Create the complete themed karaoke layout.
+        
+        Args:
+            song: Song object with metadata
+            current_sentence: Currently active sentence
+            next_sentence: Next sentence to be sung
+            previous_sentence: Previous sentence that was sung
+            current_time: Current playback time in milliseconds
+            total_duration: Total song duration in milliseconds
+            audio_enabled: Whether audio is currently enabled
+            volume: Current volume level
+            additional_info: Additional information to display
+            
+        Returns:
+            Rich Layout object
+        """
+        layout = self._build_layout_skeleton()
+        self._populate_layout(
+            layout, song, current_sentence, next_sentence, previous_sentence,
+            current_time, total_duration, audio_enabled, volume, additional_info
+        )
+        return layout
+    
+    def update_karaoke_layout(self, song: Song, current_sentence: Optional[Sentence],
+                              next_sentence: Optional[Sentence],
+                              previous_sentence: Optional[Sentence],
+                              current_time: int, total_duration: int,
+                              audio_enabled: bool = False, volume: float = 0.7,
+                              additional_info: Optional[str] = None) -> "Layout":
+        """Update the reusable karaoke layout in place.
+        
+        Unlike create_karaoke_layout, the layout tree is allocated once and
+        only its section renderables are replaced on each call. The header
+        and footer are only rebuilt when their content changed, and the
+        skeleton is rebuilt if the progress bar setting changed.
+        
+        Args:
+            song: Song object with metadata
+            current_sentence: Currently active sentence
+            next_sentence: Next sentence to be sung
+            previous_sentence: Previous sentence that was sung
+            current_time: Current playback time in milliseconds
+            total_duration: Total song duration in milliseconds
+            audio_enabled: Whether audio is currently enabled
+            volume: Current volume level
+            additional_info: Additional information to display
+            
+        Returns:
+            The shared Rich Layout object
+        """
+        show_progress_bar = self.display_config.show_progress_bar
+        if self._layout is None or self._layout_show_progress != show_progress_bar:
+            self._layout = self._build_layout_skeleton()
+            self._layout_show_progress = show_progress_bar
+            self._section_keys.clear()
+        
+        layout = self._layout
+        header_key = (id(song), audio_enabled, volume, id(self.styles))
+        if self._section_keys.get("header") != header_key:
+            layout["header"].update(self.create_header_panel(song, audio_enabled, volume))
+            self._section_keys["header"] = header_key
+        
+        self.update_lyrics(layout, current_sentence, next_sentence, previous_sentence, current_time)
+        self.update_progress(layout, current_time, total_duration)
+        
+        footer_key = (additional_info, id(self.styles))
+        if self._section_keys.get("footer") != footer_key:
+            layout["footer"].update(self.create_footer_panel(additional_info))
+            self._section_keys["footer"] = footer_key
+        return layout
+    
+    def update_progress(self, layout: "Layout", current_time: int, total_duration: int) -> None:
+        """Refresh only the progress section of an existing karaoke layout.
         
+        Args:
+            layout: Layout previously returned by create_karaoke_layout
+            current_time: Current playback time in milliseconds
+            total_duration: Total song duration in milliseconds
+        """
         if self.display_config.show_progress_bar:
             layout["progress"].update(self.create_progress_bar(current_time, total_duration))
+    
+    def update_lyrics(self, layout: "Layout", current_sentence: Optional[Sentence],
+                      next_sentence: Optional[Sentence],
+                      previous_sentence: Optional[Sentence],
+                      current_time: int) -> None:
+        """Refresh only the lyrics section of an existing karaoke layout.
         
-        layout["footer"].update(self.create_footer_panel(additional_info))
-        
-        return layout
+        Args:
+            layout: Layout previously returned by create_karaoke_layout
+            current_sentence: Currently active sentence
+            next_sentence: Next sentence to be sung
+            previous_sentence: Previous sentence that was sung
+            current_time: Current playback time in milliseconds
+        """
+        layout["main"].update(self.create_lyrics_panel(
+            current_sentence, next_sentence, previous_sentence, current_time
+        ))
     
-    def create_song_list_table(self, songs_info: List[Dict[str, str]]) -> Table:
+    def create_song_list_table(self, songs_info: List[SongMenuEntry]) -> "Table":
         """Create a themed table displaying song information.
         
         Args:
-            songs_info: List of dictionaries containing song information
+            songs_info: Song menu entries, as returned by
+                LyricsLoader.get_song_entries
             
         Returns:
             Rich Table with song information
         """
+        rows = tuple(songs_info)
+        return self._cached_panel(("songs", rows), lambda: self._build_song_list_table(rows))
+    
+    def _build_song_list_table(self, rows: Tuple[SongMenuEntry, ...]) -> "Table":
+        """Build the song table for create_song_list_table.
+        
+        Args:
+            rows: Menu entry of each song
+            
+        Returns:
+            Rich Table with song information
+        """
+        from rich.table import Table
+        
         table = Table(
-            title=f"[{self.theme.accent}]🎵 Available Songs",
+            title=self._titles["songs"],
             box=ROUNDED,
-            border_style=self.theme.border,
-            header_style=f"bold {self.theme.primary}"
+            border_style=self.styles.border,
+            header_style=self.styles.primary + BOLD
         )
         
-        table.add_column("#", style=self.theme.text_secondary, width=4)
-        table.add_column("Title", style=f"bold {self.theme.text_primary}")
-        table.add_column("Artist", style=self.theme.secondary)
-        table.add_column("File", style=self.theme.text_secondary)
-        
-        for i, song_info in enumerate(songs_info, 1):
-            table.add_row(
-                str(i),
-                song_info.get('title', 'Unknown'),
-                song_info.get('artist', 'Unknown'),
-                song_info.get('filename', 'Unknown')
-            )
+        table.add_column("#", style=self.styles.text_secondary, width=4)
+        table.add_column("Title", style=self.styles.text_primary + BOLD)
+        table.add_column("Artist", style=self.styles.secondary)
+        table.add_column("File", style=self.styles.text_secondary)
+        
+        for i, entry in enumerate(rows, 1):
+            table.add_row(str(i), entry.title, entry.artist, entry.filename)
         
         return table
     
     def create_welcome_panel(self, app_name: str = "Karaoke Rich") -> Panel:
         """Create a themed welcome panel.
         
+        Args:
+            app_name: Name of the application
+            
+        Returns:
+            Rich Panel with welcome message
+        """
+        return self._cached_panel(("welcome", app_name), lambda: self._build_welcome_panel(app_name))
+    
+    def _build_welcome_panel(self, app_name: str) -> Panel:
+        """Build the welcome panel for create_welcome_panel.
+        
         Args:
             app_name: Name of the application
             
@@ -402,19 +766,19 @@ class KaraokeLayoutBuilder:
             Rich Panel with welcome message
         """
         welcome_text = Text()
-        welcome_text.append("🎤 Welcome to ", style=self.theme.text_primary)
-        welcome_text.append(app_name, style=f"bold {self.theme.accent}")
-        welcome_text.append("! 🎵", style=self.theme.text_primary)
+        welcome_text.append("🎤 Welcome to ", style=self.styles.text_primary)
+        welcome_text.append(app_name, style=self.styles.accent + BOLD)
+        welcome_text.append("! 🎵", style=self.styles.text_primary)
         
         subtitle = Text(
             "Terminal-based Karaoke Player with Rich UI",
-            style=self.theme.text_secondary
+            style=self.styles.text_secondary
         )
         
         instructions = Text()
-        instructions.append("Select a song by entering its number, or ", style=self.theme.text_secondary)
-        instructions.append("'q'", style=f"bold {self.theme.accent}")
-        instructions.append(" to quit.", style=self.theme.text_secondary)
+        instructions.append("Select a song by entering its number, or ", style=self.styles.text_secondary)
+        instructions.append("'q'", style=self.styles.accent + BOLD)
+        instructions.append(" to quit.", style=self.styles.text_secondary)
         
         content = Group(
             Align.center(welcome_text),
@@ -425,8 +789,8 @@ class KaraokeLayoutBuilder:
         
         return Panel(
             content,
-            title=f"[{self.theme.accent}]🎵 Karaoke Rich",
-            border_style=self.theme.border,
+            title=self._titles["welcome"],
+            border_style=self.styles.border,
             box=DOUBLE,
             padding=(1, 2)
         )
@@ -434,6 +798,21 @@ class KaraokeLayoutBuilder:
     def create_theme_selection_panel(self, available_themes: Dict[str, str], current_theme: str) -> Panel:
         """Create a panel for theme selection.
         
+        Args:
+            available_themes: Dictionary of theme keys to display names
+            current_theme: Currently selected theme key
+            
+        Returns:
+            Rich Panel for theme selection
+        """
+        key = ("themes", tuple(available_themes.items()), current_theme)
+        return self._cached_panel(
+            key, lambda: self._build_theme_selection_panel(available_themes, current_theme)
+        )
+    
+    def _build_theme_selection_panel(self, available_themes: Dict[str, str], current_theme: str) -> Panel:
+        """Build the theme selection panel for create_theme_selection_panel.
+        
         Args:
             available_themes: Dictionary of theme keys to display names
             current_theme: Currently selected theme key
@@ -442,25 +821,25 @@ class KaraokeLayoutBuilder:
             Rich Panel for theme selection
         """
         content = []
-        content.append(Text("Available Themes:", style=f"bold {self.theme.text_primary}"))
+        content.append(Text("Available Themes:", style=self.styles.text_primary + BOLD))
         content.append(Text(""))  # Empty line
         
         for i, (key, name) in enumerate(available_themes.items(), 1):
             theme_text = Text()
             if key == current_theme:
-                theme_text.append(f"► {i}. {name} (current)", style=f"bold {self.theme.accent}")
+                theme_text.append(f"► {i}. {name} (current)", style=self.styles.accent + BOLD)
             else:
-                theme_text.append(f"  {i}. {name}", style=self.theme.text_primary)
+                theme_text.append(f"  {i}. {name}", style=self.styles.text_primary)
             content.append(theme_text)
         
         content.append(Text(""))  # Empty line
         content.append(Text("Enter theme number to switch, or press any other key to continue.", 
-                           style=self.theme.text_secondary))
+                           style=self.styles.text_secondary))
         
         return Panel(
             Group(*content),
-            title=f"[{self.theme.accent}]🎨 Theme Selection",
-            border_style=self.theme.border,
+            title=self._titles["themes"],
+            border_style=self.styles.border,
             box=ROUNDED,
             padding=(1, 2)
         )
@@ -497,13 +876,13 @@ class KaraokeLayoutBuilder:
             Rich Panel with loading information
         """
         loading_text = Text()
-        loading_text.append("⏳ ", style=self.theme.accent)
-        loading_text.append(message, style=self.theme.text_primary)
+        loading_text.append("⏳ ", style=self.styles.accent)
+        loading_text.append(message, style=self.styles.text_primary)
         
         return Panel(
             Align.center(loading_text),
-            title=f"[{self.theme.accent}]⏳ Loading",
-            border_style=self.theme.border,
+            title=self._titles["loading"],
+            border_style=self.styles.border,
             box=ROUNDED,
             padding=(1, 2)
         )
@@ -519,6 +898,12 @@ class KaraokeLayoutBuilder:
         """
         if self.config_manager.set_theme(theme_name):
             self.theme = self.config_manager.get_theme()
+            self.styles = self.config_manager.get_theme_styles()
+            self._active_styles = self._build_active_styles()
+            self._controls_text = self._build_controls_text()
+            self._titles = self._build_titles()
+            self._lyrics_cache.clear()
+            self._panel_cache.clear()
             return True
         return False
     
@@ -538,7 +923,7 @@ class KaraokeLayoutBuilder:
         """
         return self.config_manager.config.theme
     
-    def create_song_info_table(self, song: Song) -> Table:
+    def create_song_info_table(self, song: Song) -> "Table":
         """Create a table with song information.
         
         Args:
@@ -547,17 +932,18 @@ class KaraokeLayoutBuilder:
         Returns:
             Rich Table object
         """
+        from rich.table import Table
         from utils import get_sentence_count, get_word_count
         
         info_table = Table(
-            title=f"[{self.theme.accent}]📊 Song Information", 
+            title=self._titles["song_info"], 
             show_header=True, 
-            header_style=f"bold {self.theme.primary}",
+            header_style=self.styles.primary + BOLD,
             box=ROUNDED,
-            border_style=self.theme.border
+            border_style=self.styles.border
         )
-        info_table.add_column("Property", style=self.theme.text_primary, justify="center")
-        info_table.add_column("Details", style=self.theme.secondary, justify="center")
+        info_table.add_column("Property", style=self.styles.text_primary, justify="center")
+        info_table.add_column("Details", style=self.styles.secondary, justify="center")
         
         info_table.add_row("🎵 Title", song.title)
         info_table.add_row("🎤 Artist", song.artist)
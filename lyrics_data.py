@@ -4,62 +4,216 @@ This module handles loading and parsing lyrics from JSON files,
 and provides data models for structured lyrics representation.
 """
 
+import atexit
 import json
+import mmap
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
+from json_utils import ORJSON_AVAILABLE, loads
 
-@dataclass
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+MMAP_THRESHOLD = 64 * 1024  # Files at least this large are parsed from a memory map
+SONG_INFO_WORKERS = 8  # Threads reading song info files in parallel
+INFO_FIELDS = ('title', 'artist')  # Top-level fields shown in the song menu
+SCALAR_EVENTS = frozenset(('string', 'number', 'boolean', 'null'))  # ijson value events
+SONG_INFO_CACHE_FILE = Path.home() / ".cache" / "karaoke_rich" / "song_index.json"
+
+
+@dataclass(slots=True)
 class Word:
     """Represents a single word with timing information."""
     time: int  # Time in milliseconds
     text: str  # The word text
 
 
-@dataclass
+@dataclass(slots=True)
 class Sentence:
-    """Represents a sentence containing multiple words."""
+    """Represents a sentence containing multiple words.
+    
+    Word times are also packed into a contiguous int array so timing
+    lookups don't have to visit every Word object, and the words are
+    joined once into the displayed line with each word's character span.
+    """
     words: List[Word]
+    word_times: array = field(init=False, repr=False, compare=False)
+    plain_text: str = field(init=False, repr=False, compare=False)
+    word_starts: array = field(init=False, repr=False, compare=False)
+    word_ends: array = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.word_times = array('i', [word.time for word in self.words])
+        self.plain_text = " ".join([word.text for word in self.words])
+        
+        # Words are separated by a single space in plain_text
+        starts, ends = array('i'), array('i')
+        offset = 0
+        for word in self.words:
+            starts.append(offset)
+            offset += len(word.text)
+            ends.append(offset)
+            offset += 1
+        self.word_starts = starts
+        self.word_ends = ends
     
     @property
     def start_time(self) -> int:
         """Get the start time of the sentence."""
-        return self.words[0].time if self.words else 0
+        return self.word_times[0] if self.words else 0
     
     @property
     def end_time(self) -> int:
         """Get the end time of the sentence with buffer."""
-        return self.words[-1].time + 1000 if self.words else 0
+        return self.word_times[-1] + 1000 if self.words else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Song:
-    """Represents a complete song with metadata and lyrics."""
+    """Represents a complete song with metadata and lyrics.
+    
+    Besides the keyed sentences, the song keeps an immutable tuple of its
+    (key, sentence) entries ordered by start time, with their start times
+    packed into an int array, so the sentence at a given time can be found
+    by binary search. Their end times are packed alongside, and the song's
+    duration and sentence and word counts are also computed once.
+    """
     title: str
     artist: str
     sentences: Dict[str, Sentence]
+    sentence_entries: Tuple[Tuple[str, Sentence], ...] = field(init=False, repr=False, compare=False)
+    sentence_starts: array = field(init=False, repr=False, compare=False)
+    sentence_ends: array = field(init=False, repr=False, compare=False)
+    total_duration: int = field(init=False, repr=False, compare=False)
+    sentence_count: int = field(init=False, repr=False, compare=False)
+    word_count: int = field(init=False, repr=False, compare=False)
     
-    @property
-    def total_duration(self) -> int:
-        """Get the total duration of the song in milliseconds."""
-        if not self.sentences:
-            return 0
-        last_sentence = list(self.sentences.values())[-1]
-        return last_sentence.end_time
+    def __post_init__(self):
+        self.sentence_entries = tuple(sorted(self.sentences.items(), key=lambda entry: entry[1].start_time))
+        self.sentence_starts = array('i', [sentence.start_time for _, sentence in self.sentence_entries])
+        self.sentence_ends = array('i', [sentence.end_time for _, sentence in self.sentence_entries])
+        # Total duration in milliseconds: the end of the last sentence
+        self.total_duration = (
+            next(reversed(self.sentences.values())).end_time if self.sentences else 0
+        )
+        self.sentence_count = len(self.sentences)
+        self.word_count = sum(len(sentence.words) for _, sentence in self.sentence_entries)
+
+
+class SongMenuEntry(NamedTuple):
+    """A song as listed in the song menu."""
+    filename: str  # Lyrics file name without the .json extension
+    title: str
+    artist: str
+
+
+def _read_json(file_path: Path) -> Any:
+    """Read and parse a JSON file.
+    
+    With orjson, files of MMAP_THRESHOLD bytes or more are parsed straight
+    from a read-only memory map instead of being copied into a bytes
+    object first. Smaller files are read normally, as mapping them costs
+    more than the copy.
+    
+    Args:
+        file_path: Path of the JSON file
+        
+    Returns:
+        Parsed JSON value
+        
+    Raises:
+        OSError: If the file can't be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(file_path, 'rb') as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return loads(view)
+        return loads(f.read())
+
+
+def _info_text(value: Any) -> str:
+    """Convert a title or artist JSON value to the text shown in the menu.
+    
+    ijson reports numbers as Decimal, which the song info cache can't
+    serialize, so every scalar is stored as a string.
+    
+    Args:
+        value: Parsed JSON value of the field
+        
+    Returns:
+        The value as a string, 'Unknown' for null
+    """
+    if value is None:
+        return 'Unknown'
+    return value if isinstance(value, str) else str(value)
+
+
+def _read_song_info(file_path: Path) -> Dict[str, str]:
+    """Read the title and artist of a lyrics file.
+    
+    With ijson, the file is streamed and reading stops as soon as both
+    top-level fields were seen, so the sentences are usually never parsed.
+    Otherwise, or when the fields can't be streamed, the whole file is
+    parsed.
+    
+    Args:
+        file_path: Path of the lyrics JSON file
+        
+    Returns:
+        Dictionary with title and artist as strings, 'Unknown' for
+        missing or null fields
+        
+    Raises:
+        OSError: If the file can't be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if IJSON_AVAILABLE:
+        info = {}
+        try:
+            with open(file_path, 'rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if prefix in INFO_FIELDS and event in SCALAR_EVENTS:
+                        info[prefix] = _info_text(value)
+                        if len(info) == len(INFO_FIELDS):
+                            return {name: info[name] for name in INFO_FIELDS}
+        except ijson.JSONError:
+            # Let the full parse below report the error
+            pass
+    
+    data = _read_json(file_path)
+    return {name: _info_text(data.get(name)) for name in INFO_FIELDS}
 
 
 class LyricsLoader:
     """Handles loading lyrics from JSON files."""
     
-    def __init__(self, lyrics_dir: str = "lyrics"):
+    def __init__(self, lyrics_dir: str = "lyrics",
+                 cache_file: Optional[Path] = SONG_INFO_CACHE_FILE):
         """Initialize the lyrics loader.
         
         Args:
             lyrics_dir: Directory containing lyrics JSON files
+            cache_file: File keeping song info between runs, or None to only
+                cache it in memory
         """
         self.lyrics_dir = Path(lyrics_dir)
+        self.cache_file = cache_file
+        # Song list and song info, reused until the file's mtime changes.
+        # Song info is keyed by absolute path and persisted to cache_file
+        self._songs_cache: Optional[Tuple[int, List[str]]] = None
+        self._info_cache: Dict[str, Tuple[int, Dict[str, str]]] = {}
+        self._info_cache_loaded = False
+        self._info_cache_dirty = False
     
     def load_song(self, filename: str) -> Song:
         """Load a song from a JSON file.
@@ -82,10 +236,7 @@ class LyricsLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"Lyrics file not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return self._parse_song_data(data)
+        return self._parse_song_data(_read_json(file_path))
     
     def _parse_song_data(self, data: dict) -> Song:
         """Parse JSON data into Song object.
@@ -96,11 +247,10 @@ class LyricsLoader:
         Returns:
             Song object
         """
-        sentences = {}
-        
-        for sentence_key, words_data in data['sentences'].items():
-            words = [Word(time=word['time'], text=word['text']) for word in words_data]
-            sentences[sentence_key] = Sentence(words=words)
+        sentences = {
+            sentence_key: Sentence([Word(word['time'], word['text']) for word in words_data])
+            for sentence_key, words_data in data['sentences'].items()
+        }
         
         return Song(
             title=data['title'],
@@ -111,21 +261,34 @@ class LyricsLoader:
     def list_available_songs(self) -> List[str]:
         """List all available song files in the lyrics directory.
         
+        The directory is only listed again when its modification time
+        changes, which happens whenever a file is added, removed or renamed.
+        
         Returns:
             List of song filenames (without .json extension)
         """
-        if not self.lyrics_dir.exists():
+        try:
+            mtime = os.stat(self.lyrics_dir).st_mtime_ns
+            if self._songs_cache is None or self._songs_cache[0] != mtime:
+                with os.scandir(self.lyrics_dir) as entries:
+                    songs = sorted(
+                        entry.name[:-5] for entry in entries
+                        if entry.name.endswith('.json') and entry.is_file()
+                    )
+                self._songs_cache = (mtime, songs)
+        except (FileNotFoundError, NotADirectoryError):
+            self._songs_cache = None
             return []
         
-        songs = []
-        for file_path in self.lyrics_dir.glob('*.json'):
-            songs.append(file_path.stem)
-        
-        return sorted(songs)
+        return list(self._songs_cache[1])
     
     def get_song_info(self, filename: str) -> Optional[Dict[str, str]]:
         """Get basic information about a song without loading full lyrics.
         
+        The result is cached per file and reused until the file's
+        modification time changes, including across runs through the
+        song info cache file.
+        
         Args:
             filename: Name of the JSON file
             
@@ -137,13 +300,97 @@ class LyricsLoader:
                 filename += '.json'
             
             file_path = self.lyrics_dir / filename
+            cache_key = os.path.abspath(file_path)
+            mtime = file_path.stat().st_mtime_ns
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            self._load_info_cache()
+            cached = self._info_cache.get(cache_key)
+            if cached is not None and cached[0] == mtime:
+                return dict(cached[1])
             
-            return {
-                'title': data.get('title', 'Unknown'),
-                'artist': data.get('artist', 'Unknown')
-            }
+            info = _read_song_info(file_path)
+            self._info_cache[cache_key] = (mtime, info)
+            self._info_cache_dirty = True
+            return dict(info)
         except (FileNotFoundError, json.JSONDecodeError, KeyError):
-            return None
\ No newline at end of file
+            return None
+    
+    def get_song_infos(self, filenames: Iterable[str]) -> List[Optional[Dict[str, str]]]:
+        """Get basic information about several songs at once.
+        
+        The files are read on a small thread pool so their I/O overlaps;
+        results keep the order of the filenames.
+        
+        Args:
+            filenames: Names of the JSON files
+            
+        Returns:
+            Song info for each file as returned by get_song_info, in
+            request order
+        """
+        filenames = list(filenames)
+        # Load the persisted cache before the worker threads share it
+        self._load_info_cache()
+        if len(filenames) < 2:
+            return [self.get_song_info(filename) for filename in filenames]
+        
+        with ThreadPoolExecutor(max_workers=min(SONG_INFO_WORKERS, len(filenames))) as executor:
+            return list(executor.map(self.get_song_info, filenames))
+    
+    def get_song_entries(self, filenames: Iterable[str]) -> List[SongMenuEntry]:
+        """Get the song menu entries of several songs.
+        
+        Args:
+            filenames: Names of the JSON files, without the .json extension
+            
+        Returns:
+            One entry per file, in request order; title and artist are
+            'Unknown' for files that can't be read
+        """
+        filenames = list(filenames)
+        return [
+            SongMenuEntry(filename, info['title'], info['artist']) if info
+            else SongMenuEntry(filename, 'Unknown', 'Unknown')
+            for filename, info in zip(filenames, self.get_song_infos(filenames))
+        ]
+    
+    def _load_info_cache(self) -> None:
+        """Load the persisted song info cache on first use.
+        
+        Entries are only trusted while their file's modification time
+        matches, so a stale or foreign cache file is harmless. The cache is
+        written back when the program exits.
+        """
+        if self._info_cache_loaded:
+            return
+        self._info_cache_loaded = True
+        if self.cache_file is None:
+            return
+        
+        atexit.register(self.save_info_cache)
+        try:
+            files = loads(self.cache_file.read_bytes())['files']
+            for path, (mtime, title, artist) in files.items():
+                self._info_cache.setdefault(path, (int(mtime), {'title': _info_text(title), 'artist': _info_text(artist)}))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # Missing or unreadable cache: song info is read from the files
+            pass
+    
+    def save_info_cache(self) -> None:
+        """Write the song info cache to the cache file if it changed."""
+        if not self._info_cache_dirty or self.cache_file is None:
+            return
+        
+        files = {
+            path: [mtime, info['title'], info['artist']]
+            for path, (mtime, info) in self._info_cache.items()
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix('.tmp')
+            temp_file.write_text(json.dumps({'files': files}, ensure_ascii=False), encoding='utf-8')
+            os.replace(temp_file, self.cache_file)
+            self._info_cache_dirty = False
+        except (OSError, TypeError, ValueError):
+            # Saving is best effort and runs at exit, so it must never raise
+            pass
@@ -8,25 +8,24 @@ real-time lyrics synchronization, audio support, themes, and beautiful visual ef
 
 import sys
 import os
-import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict
 from rich.console import Console
-from rich.panel import Panel
 from rich.table import Table
-from rich.prompt import Prompt, Confirm
-from rich.text import Text
-from rich.align import Align
-from rich.layout import Layout
-from rich.live import Live
-from rich.columns import Columns
+from rich.prompt import Prompt
 from rich import box
 
-from lyrics_data import LyricsLoader, Song
+from lyrics_data import LyricsLoader, Song, SongMenuEntry
 from karaoke_player import KaraokePlayer
 from layout_builder import KaraokeLayoutBuilder
 from config import ConfigManager
-from audio_player import create_audio_player
+
+AUDIO_FILE_EXTENSIONS = frozenset(('.mp3', '.wav', '.ogg', '.m4a'))
+
+# Fixed menu choices, shared by every prompt instead of rebuilt each time
+MAIN_MENU_CHOICES = ["play", "settings", "themes", "audio", "exit"]
+SETTINGS_CHOICES = ["refresh", "progress", "time", "sentences", "back"]
+AUDIO_CHOICES = ["toggle", "volume", "back"]
 
 
 class KaraokeApp:
@@ -48,6 +47,8 @@ class KaraokeApp:
         self.layout_builder = self.player.layout_builder
         self.current_song: Optional[Song] = None
         self.audio_files: Dict[str, str] = {}  # Map song names to audio file paths
+        self._menu_options: Optional[Table] = None  # Static main menu table, built on first use
+        self._status: Optional[str] = None  # Message shown at the top of the next menu redraw
         
         # Set up callbacks
         self.player.on_song_end = self._on_song_end
@@ -56,7 +57,6 @@ class KaraokeApp:
     def run(self) -> None:
         """Run the main application loop."""
         try:
-            self._show_welcome()
             self._scan_audio_files()
             self._main_menu()
         except KeyboardInterrupt:
@@ -71,13 +71,30 @@ class KaraokeApp:
         """Display the welcome screen with theme support."""
         welcome_layout = self.layout_builder.create_welcome_panel()
         self.console.print(welcome_layout)
-        time.sleep(2)
+    
+    def _notify(self, message: str) -> None:
+        """Show a status message at the top of the next menu redraw.
+        
+        Menus redraw right after each action, so the message appears at
+        once without holding up the menu.
+        
+        Args:
+            message: Rich markup message
+        """
+        self._status = message
+    
+    def _show_status(self) -> None:
+        """Print and clear the pending status message, if any."""
+        if self._status:
+            self.console.print(self._status)
+            self._status = None
     
     def _main_menu(self) -> None:
         """Display and handle the main menu with enhanced options."""
         while True:
             self.console.clear()
             self._show_welcome()
+            self._show_status()
             
             # Get available songs
             song_files = self.lyrics_loader.list_available_songs()
@@ -86,19 +103,7 @@ class KaraokeApp:
                 self.console.print("[bold red]❌ No songs found![/bold red]")
                 return
             
-            # Convert to song info format
-            songs = []
-            for filename in song_files:
-                song_info = self.lyrics_loader.get_song_info(filename)
-                if song_info:
-                    song_info['filename'] = filename
-                    songs.append(song_info)
-                else:
-                    songs.append({
-                        'title': 'Unknown',
-                        'artist': 'Unknown',
-                        'filename': filename
-                    })
+            songs = self.lyrics_loader.get_song_entries(song_files)
             
             # Display main menu options
             self._display_main_menu(songs)
@@ -117,8 +122,7 @@ class KaraokeApp:
             elif choice == "audio":
                 self._audio_menu()
             else:
-                self.console.print("[bold red]❌ Invalid choice![/bold red]")
-                time.sleep(1)
+                self._notify("[bold red]❌ Invalid choice![/bold red]")
     
     def _display_main_menu(self, songs: list) -> None:
         """Display the main menu options.
@@ -130,18 +134,20 @@ class KaraokeApp:
         song_table = self.layout_builder.create_song_list_table(songs)
         self.console.print(song_table)
         
-        # Display menu options
-        menu_options = Table(title="🎮 Main Menu", box=box.ROUNDED)
-        menu_options.add_column("Option", style="cyan", width=10)
-        menu_options.add_column("Description", style="white")
-        
-        menu_options.add_row("[bold green]play[/bold green]", "🎵 Select and play a song")
-        menu_options.add_row("[bold blue]settings[/bold blue]", "⚙️ Application settings")
-        menu_options.add_row("[bold magenta]themes[/bold magenta]", "🎨 Change theme")
-        menu_options.add_row("[bold yellow]audio[/bold yellow]", "🔊 Audio settings")
-        menu_options.add_row("[bold red]exit[/bold red]", "👋 Exit application")
+        # Display menu options; the table never changes, so it is built once
+        if self._menu_options is None:
+            menu_options = Table(title="🎮 Main Menu", box=box.ROUNDED)
+            menu_options.add_column("Option", style="cyan", width=10)
+            menu_options.add_column("Description", style="white")
+            
+            menu_options.add_row("[bold green]play[/bold green]", "🎵 Select and play a song")
+            menu_options.add_row("[bold blue]settings[/bold blue]", "⚙️ Application settings")
+            menu_options.add_row("[bold magenta]themes[/bold magenta]", "🎨 Change theme")
+            menu_options.add_row("[bold yellow]audio[/bold yellow]", "🔊 Audio settings")
+            menu_options.add_row("[bold red]exit[/bold red]", "👋 Exit application")
+            self._menu_options = menu_options
         
-        self.console.print(menu_options)
+        self.console.print(self._menu_options)
     
     def _get_main_menu_choice(self) -> str:
         """Get and validate main menu choice.
@@ -151,19 +157,21 @@ class KaraokeApp:
         """
         choice = Prompt.ask(
             "\n🎯 Choose an option",
-            choices=["play", "settings", "themes", "audio", "exit"],
+            choices=MAIN_MENU_CHOICES,
             default="play"
         )
         return choice
     
     def _scan_audio_files(self) -> None:
         """Scan for audio files and map them to songs."""
-        audio_dir = Path("audio")
-        if audio_dir.exists():
-            for audio_file in audio_dir.glob("*"):
-                if audio_file.suffix.lower() in ['.mp3', '.wav', '.ogg', '.m4a']:
-                    song_name = audio_file.stem
-                    self.audio_files[song_name] = str(audio_file)
+        try:
+            with os.scandir("audio") as entries:
+                for entry in entries:
+                    song_name, extension = os.path.splitext(entry.name)
+                    if extension.lower() in AUDIO_FILE_EXTENSIONS and entry.is_file():
+                        self.audio_files[song_name] = entry.path
+        except FileNotFoundError:
+            pass
     
     def _song_selection_menu(self, songs: list) -> None:
         """Handle song selection and playback."""
@@ -180,20 +188,25 @@ class KaraokeApp:
             song_info = songs[song_index]
             self._play_selected_song(song_info)
     
-    def _play_selected_song(self, song_info: dict) -> None:
+    def _play_selected_song(self, song_info: SongMenuEntry) -> None:
         """Play the selected song."""
-        filename = song_info['filename']
+        filename = song_info.filename
         song = self.lyrics_loader.load_song(filename)
         
         if song:
             # Check for audio file
             audio_file = self.audio_files.get(filename)
-            self.player.play_song(song, audio_file)
+            self.player.play_song(
+                song,
+                refresh_rate=self.config_manager.config.display.refresh_rate,
+                audio_file=audio_file
+            )
     
     def _settings_menu(self) -> None:
         """Display and handle settings menu."""
         while True:
             self.console.clear()
+            self._show_status()
             
             settings_table = Table(title="⚙️ Settings", box=box.ROUNDED)
             settings_table.add_column("Setting", style="cyan")
@@ -226,11 +239,13 @@ class KaraokeApp:
             
             choice = Prompt.ask(
                 "\n🔧 What would you like to change?",
-                choices=["refresh", "progress", "time", "sentences", "back"],
+                choices=SETTINGS_CHOICES,
                 default="back"
             )
             
             if choice == "back":
+                # Write the settings changed in this menu at once
+                self.config_manager.flush()
                 break
             elif choice == "refresh":
                 self._change_refresh_rate()
@@ -243,30 +258,34 @@ class KaraokeApp:
     
     def _theme_menu(self) -> None:
         """Display and handle theme selection."""
+        # The available themes don't change while the menu is open, so the
+        # table and the prompt choices are built once
+        themes = self.layout_builder.get_available_themes()
+        theme_table = Table(title="Available Themes", box=box.ROUNDED)
+        theme_table.add_column("#", style="cyan", width=3)
+        theme_table.add_column("Theme Name", style="magenta")
+        theme_table.add_column("Description", style="white")
+        
+        for i, theme_name in enumerate(themes, 1):
+            theme_table.add_row(
+                str(i), 
+                theme_name.title(), 
+                f"Switch to {theme_name} theme"
+            )
+        
+        choices = [str(i) for i in range(1, len(themes) + 1)] + ["back"]
+        
         while True:
             self.console.clear()
+            self._show_status()
             
             # Display current theme
             current_theme = self.layout_builder.get_current_theme_name()
             self.console.print(f"[bold cyan]🎨 Current Theme: {current_theme}[/bold cyan]\n")
             
             # Display available themes
-            themes = self.layout_builder.get_available_themes()
-            theme_table = Table(title="Available Themes", box=box.ROUNDED)
-            theme_table.add_column("#", style="cyan", width=3)
-            theme_table.add_column("Theme Name", style="magenta")
-            theme_table.add_column("Description", style="white")
-            
-            for i, theme_name in enumerate(themes, 1):
-                theme_table.add_row(
-                    str(i), 
-                    theme_name.title(), 
-                    f"Switch to {theme_name} theme"
-                )
-            
             self.console.print(theme_table)
             
-            choices = [str(i) for i in range(1, len(themes) + 1)] + ["back"]
             choice = Prompt.ask(
                 "\n🎨 Select a theme or 'back' to return",
                 choices=choices,
@@ -279,13 +298,13 @@ class KaraokeApp:
                 theme_index = int(choice) - 1
                 theme_name = themes[theme_index]
                 self.layout_builder.update_theme(theme_name)
-                self.console.print(f"[bold green]✅ Theme changed to {theme_name}![/bold green]")
-                time.sleep(1)
+                self._notify(f"[bold green]✅ Theme changed to {theme_name}![/bold green]")
     
     def _audio_menu(self) -> None:
         """Display and handle audio settings."""
         while True:
             self.console.clear()
+            self._show_status()
             
             audio_table = Table(title="🔊 Audio Settings", box=box.ROUNDED)
             audio_table.add_column("Setting", style="cyan")
@@ -323,11 +342,12 @@ class KaraokeApp:
             
             choice = Prompt.ask(
                 "\n🔊 What would you like to change?",
-                choices=["toggle", "volume", "back"],
+                choices=AUDIO_CHOICES,
                 default="back"
             )
             
             if choice == "back":
+                self.config_manager.flush()
                 break
             elif choice == "toggle":
                 self._toggle_audio()
@@ -347,53 +367,44 @@ class KaraokeApp:
         try:
             rate = int(Prompt.ask("Enter new refresh rate (1-60 Hz)", default="10"))
             if 1 <= rate <= 60:
-                self.config_manager.config.display.refresh_rate = rate
-                self.config_manager.save_config()
-                self.console.print(f"[bold green]✅ Refresh rate set to {rate} Hz![/bold green]")
+                self.config_manager.update_display_config(refresh_rate=rate)
+                self._notify(f"[bold green]✅ Refresh rate set to {rate} Hz![/bold green]")
             else:
-                self.console.print("[bold red]❌ Rate must be between 1 and 60![/bold red]")
+                self._notify("[bold red]❌ Rate must be between 1 and 60![/bold red]")
         except ValueError:
-            self.console.print("[bold red]❌ Invalid number![/bold red]")
-        time.sleep(1)
+            self._notify("[bold red]❌ Invalid number![/bold red]")
     
     def _toggle_progress_bar(self) -> None:
         """Toggle progress bar display."""
         config = self.config_manager.config
-        config.display.show_progress_bar = not config.display.show_progress_bar
-        self.config_manager.save_config()
+        self.config_manager.update_display_config(show_progress_bar=not config.display.show_progress_bar)
         status = "enabled" if config.display.show_progress_bar else "disabled"
-        self.console.print(f"[bold green]✅ Progress bar {status}![/bold green]")
-        time.sleep(1)
+        self._notify(f"[bold green]✅ Progress bar {status}![/bold green]")
     
     def _toggle_time_info(self) -> None:
         """Toggle time info display."""
         config = self.config_manager.config
-        config.display.show_time_info = not config.display.show_time_info
-        self.config_manager.save_config()
+        self.config_manager.update_display_config(show_time_info=not config.display.show_time_info)
         status = "enabled" if config.display.show_time_info else "disabled"
-        self.console.print(f"[bold green]✅ Time info {status}![/bold green]")
-        time.sleep(1)
+        self._notify(f"[bold green]✅ Time info {status}![/bold green]")
     
     def _change_max_sentences(self) -> None:
         """Change maximum visible sentences."""
         try:
             count = int(Prompt.ask("Enter max visible sentences (1-10)", default="3"))
             if 1 <= count <= 10:
-                self.config_manager.config.display.max_visible_sentences = count
-                self.config_manager.save_config()
-                self.console.print(f"[bold green]✅ Max sentences set to {count}![/bold green]")
+                self.config_manager.update_display_config(max_visible_sentences=count)
+                self._notify(f"[bold green]✅ Max sentences set to {count}![/bold green]")
             else:
-                self.console.print("[bold red]❌ Count must be between 1 and 10![/bold red]")
+                self._notify("[bold red]❌ Count must be between 1 and 10![/bold red]")
         except ValueError:
-            self.console.print("[bold red]❌ Invalid number![/bold red]")
-        time.sleep(1)
+            self._notify("[bold red]❌ Invalid number![/bold red]")
     
     def _toggle_audio(self) -> None:
         """Toggle audio on/off."""
         new_state = self.player.toggle_audio()
         status = "enabled" if new_state else "disabled"
-        self.console.print(f"[bold green]✅ Audio {status}![/bold green]")
-        time.sleep(1)
+        self._notify(f"[bold green]✅ Audio {status}![/bold green]")
     
     def _change_volume(self) -> None:
         """Change audio volume."""
@@ -402,13 +413,12 @@ class KaraokeApp:
             if 0 <= volume <= 100:
                 volume_float = volume / 100.0
                 self.player.set_volume(volume_float)
-                self.config_manager.save_config()
-                self.console.print(f"[bold green]✅ Volume set to {volume}%![/bold green]")
+                self.config_manager.update_audio_config(volume=volume_float)
+                self._notify(f"[bold green]✅ Volume set to {volume}%![/bold green]")
             else:
-                self.console.print("[bold red]❌ Volume must be between 0 and 100![/bold red]")
+                self._notify("[bold red]❌ Volume must be between 0 and 100![/bold red]")
         except ValueError:
-            self.console.print("[bold red]❌ Invalid number![/bold red]")
-        time.sleep(1)
+            self._notify("[bold red]❌ Invalid number![/bold red]")
     
     def _cleanup(self) -> None:
         """Clean up resources."""
@@ -436,7 +446,7 @@ class KaraokeApp:
         lyrics_dir = Path("lyrics")
         if not lyrics_dir.exists():
             lyrics_dir.mkdir(exist_ok=True)
-            self.console.print(f"[yellow]📁 Đã tạo thư mục {lyrics_dir}[/yellow]")
+            self._notify(f"[yellow]📁 Đã tạo thư mục {lyrics_dir}[/yellow]")
 
 
 def main() -> None:
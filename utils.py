@@ -4,9 +4,16 @@ This module contains helper functions for time formatting,
 sentence navigation, and other common operations.
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from typing import Optional, Tuple
 from lyrics_data import Song, Sentence
 
+SentenceEntry = Tuple[Optional[str], Optional[Sentence]]
+
+SONG_END_BUFFER_MS = 3000  # Time after the last sentence before a song counts as finished
+
 
 def format_time(ms: int) -> str:
     """Convert milliseconds to mm:ss format.
@@ -17,15 +24,29 @@ def format_time(ms: int) -> str:
     Returns:
         Formatted time string in mm:ss format
     """
-    seconds = int(ms // 1000)
-    minutes = int(seconds // 60)
-    seconds = int(seconds % 60)
+    return _format_seconds(int(ms // 1000))
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """Format whole seconds as mm:ss, memoized for format_time.
+    
+    Args:
+        seconds: Time in whole seconds
+        
+    Returns:
+        Formatted time string in mm:ss format
+    """
+    minutes, seconds = divmod(seconds, 60)
     return f"{minutes:02d}:{seconds:02d}"
 
 
 def get_current_sentence(song: Song, current_time: int) -> Tuple[Optional[str], Optional[Sentence]]:
     """Find the sentence currently being sung.
     
+    When sentences overlap, the earliest one still running is the current
+    one. The player uses locate_sentences instead, which favors the latest.
+    
     Args:
         song: Song object containing all lyrics
         current_time: Current playback time in milliseconds
@@ -33,10 +54,16 @@ def get_current_sentence(song: Song, current_time: int) -> Tuple[Optional[str],
     Returns:
         Tuple of (sentence_key, sentence) or (None, None) if no match
     """
-    for sentence_key, sentence in song.sentences.items():
-        if sentence.start_time <= current_time <= sentence.end_time:
-            return sentence_key, sentence
-    return None, None
+    starts, entries = get_sentence_index(song)
+    ends = song.sentence_ends
+    index = bisect_right(starts, current_time) - 1
+    
+    # Step back over the sentences overlapping the current time
+    current = (None, None)
+    while index >= 0 and current_time <= ends[index]:
+        current = entries[index]
+        index -= 1
+    return current
 
 
 def get_next_sentence(song: Song, current_time: int) -> Tuple[Optional[str], Optional[Sentence]]:
@@ -49,10 +76,9 @@ def get_next_sentence(song: Song, current_time: int) -> Tuple[Optional[str], Opt
     Returns:
         Tuple of (sentence_key, sentence) or (None, None) if no next sentence
     """
-    for sentence_key, sentence in song.sentences.items():
-        if sentence.start_time > current_time:
-            return sentence_key, sentence
-    return None, None
+    starts, entries = get_sentence_index(song)
+    index = bisect_right(starts, current_time)
+    return entries[index] if index < len(entries) else (None, None)
 
 
 def get_previous_sentence(song: Song, current_time: int) -> Tuple[Optional[str], Optional[Sentence]]:
@@ -65,17 +91,57 @@ def get_previous_sentence(song: Song, current_time: int) -> Tuple[Optional[str],
     Returns:
         Tuple of (sentence_key, sentence) or (None, None) if no previous sentence
     """
-    previous_sentence = None
-    previous_key = None
+    starts, entries = get_sentence_index(song)
+    ends = song.sentence_ends
+    index = bisect_right(starts, current_time) - 1
+    
+    # Only sentences overlapping the current time are stepped over
+    while index >= 0 and ends[index] >= current_time:
+        index -= 1
+    return entries[index] if index >= 0 else (None, None)
+
+
+def get_sentence_index(song: Song) -> Tuple[array, Tuple[Tuple[str, Sentence], ...]]:
+    """Get the sentence start times and entries of a song, sorted by time.
+    
+    The index is built once when the song is created.
+    
+    Args:
+        song: Song object
+        
+    Returns:
+        Tuple of (packed start times, (sentence_key, sentence) entries)
+    """
+    return song.sentence_starts, song.sentence_entries
+
+
+def locate_sentences(song: Song, current_time: int) -> Tuple[SentenceEntry, SentenceEntry, SentenceEntry]:
+    """Find the previous, current and next sentences with one binary search.
+    
+    When sentences overlap, the latest one to start is the current one.
+    
+    Args:
+        song: Song object containing all lyrics
+        current_time: Current playback time in milliseconds
+        
+    Returns:
+        Tuple of (previous, current, next) entries, each a
+        (sentence_key, sentence) pair or (None, None) if it doesn't exist
+    """
+    starts, entries = get_sentence_index(song)
+    index = bisect_right(starts, current_time)
     
-    for sentence_key, sentence in song.sentences.items():
-        if sentence.end_time < current_time:
-            previous_sentence = sentence
-            previous_key = sentence_key
-        else:
-            break
+    # entries[index - 1] is the last sentence that has started; it is
+    # current while it hasn't ended, otherwise it is the previous one
+    current = (None, None)
+    last_started = index - 1
+    if last_started >= 0 and current_time <= song.sentence_ends[last_started]:
+        current = entries[last_started]
+        last_started -= 1
     
-    return previous_key, previous_sentence
+    previous = entries[last_started] if last_started >= 0 else (None, None)
+    upcoming = entries[index] if index < len(entries) else (None, None)
+    return previous, current, upcoming
 
 
 def calculate_progress_percentage(current_time: int, total_duration: int) -> float:
@@ -88,11 +154,11 @@ def calculate_progress_percentage(current_time: int, total_duration: int) -> flo
     Returns:
         Progress percentage (0.0 to 100.0)
     """
-    if total_duration <= 0:
+    if total_duration <= 0 or current_time <= 0:
         return 0.0
-    
-    percentage = (current_time / total_duration) * 100
-    return min(100.0, max(0.0, percentage))
+    if current_time >= total_duration:
+        return 100.0
+    return (current_time / total_duration) * 100
 
 
 def is_word_active(word_time: int, current_time: int, highlight_duration: int = 800) -> bool:
@@ -109,7 +175,30 @@ def is_word_active(word_time: int, current_time: int, highlight_duration: int =
     return word_time <= current_time <= word_time + highlight_duration
 
 
-def is_song_finished(song: Song, current_time: int, buffer_time: int = 3000) -> bool:
+def get_active_word_range(sentence: Sentence, current_time: int,
+                          highlight_duration: int = 800) -> Tuple[int, int]:
+    """Find the words of a sentence that are currently active.
+    
+    Word times are sorted, so the words for which is_word_active holds form
+    one run, found with two binary searches instead of a check per word.
+    
+    Args:
+        sentence: Sentence object containing words
+        current_time: Current playback time (milliseconds)
+        highlight_duration: How long to highlight a word (milliseconds)
+        
+    Returns:
+        Tuple of (first active index, index past the last active word);
+        words before the first index have finished their highlight
+    """
+    times = sentence.word_times
+    return (
+        bisect_left(times, current_time - highlight_duration),
+        bisect_right(times, current_time)
+    )
+
+
+def is_song_finished(song: Song, current_time: int, buffer_time: int = SONG_END_BUFFER_MS) -> bool:
     """Check if the song has finished playing.
     
     Args:
@@ -132,7 +221,7 @@ def get_sentence_count(song: Song) -> int:
     Returns:
         Number of sentences
     """
-    return len(song.sentences)
+    return song.sentence_count
 
 
 def get_word_count(song: Song) -> int:
@@ -144,7 +233,4 @@ def get_word_count(song: Song) -> int:
     Returns:
         Total number of words
     """
-    total_words = 0
-    for sentence in song.sentences.values():
-        total_words += len(sentence.words)
-    return total_words
\ No newline at end of file
+    return song.word_count
\ No newline at end of file